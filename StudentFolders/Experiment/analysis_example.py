@@ -5,18 +5,24 @@ for accuracy and reaction time grouped by difficulty level.
 """
 import pandas as pd
 
-df = pd.read_csv('all_participants.csv')
+# Only the analysed columns are parsed; 'practice' is optional in older exports
+USECOLS = {'difficulty', 'correct', 'rt', 'practice'}
+df = pd.read_csv(
+    'all_participants.csv',
+    usecols=lambda col: col in USECOLS,
+    dtype={'difficulty': 'category', 'correct': 'bool', 'rt': 'float32', 'practice': 'bool'},
+    engine='c',
+)
 
 # drop practice trials if present
 if 'practice' in df.columns:
-    df = df[not df['practice']]
+    df = df[~df['practice'].astype(bool)]
 
+# One fused mean over both columns; observed=True skips unused difficulty categories
 summary = (
-    df.groupby(['difficulty'])
-      .agg(
-          accuracy=('correct', 'mean'),
-          rt=('rt', 'mean')
-      )
+    df.groupby('difficulty', observed=True)[['correct', 'rt']]
+      .mean()
+      .rename(columns={'correct': 'accuracy'})
 )
 
 print(summary)
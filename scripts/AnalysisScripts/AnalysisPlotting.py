@@ -41,18 +41,42 @@ JSON Schema (simplified)
 import argparse
 import json
 import os
+import re
 import shutil
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Tuple
 
 import matplotlib
-
+from matplotlib.collections import LineCollection
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from scipy.signal import fftconvolve
+from scipy.signal.windows import gaussian as gaussian_window
+
+try:
+    import ijson  # Optional: streams trialData without materializing the whole file
+
+    # The pure-Python backend is an order of magnitude slower than json.load
+    if ijson.backend == "python":
+        ijson = None
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: fastest whole-document parse
+except ImportError:
+    orjson = None
 
 # Use non-interactive backend for headless environments
 matplotlib.use("Agg")
+# Split very long paths (dense gaze traces) into chunks when rasterizing
+matplotlib.rcParams["agg.path.chunksize"] = 10000
 
 # Helper utilities for color assignment, target annotation, and aggregation.
 # Dynamic grid reinstated for per-trial plots to scale figure size to number of trials.
@@ -85,8 +109,9 @@ def create_dynamic_grid(
     -------
     fig : matplotlib.figure.Figure
         Created figure object.
-    axes : list[matplotlib.axes.Axes]
-        Flattened list of axes sized to contain n_items (excess axes hidden).
+    axes : numpy.ndarray of matplotlib.axes.Axes
+        Flattened array of the first n_items axes, one per item (the unused tail of
+        the grid is removed from the figure and not returned).
     rows : int
         Number of rows computed.
     cols : int
@@ -99,12 +124,11 @@ def create_dynamic_grid(
     fig, ax_grid = plt.subplots(
         rows, cols, figsize=(base_width, base_height * height_scale), dpi=dpi
     )
-    axes = ax_grid.flatten() if isinstance(ax_grid, np.ndarray) else [ax_grid]
-    # Hide unused axes
-    for i in range(rows * cols):
-        if i >= n_items:
-            axes[i].set_visible(False)
-    return fig, axes, rows, cols
+    axes = np.atleast_1d(ax_grid).ravel()
+    # Drop the unused tail of the grid (frees its artists instead of just hiding them)
+    for ax in axes[n_items:]:
+        ax.remove()
+    return fig, axes[:n_items], rows, cols
 
 
 def build_position_legend(fig: "matplotlib.figure.Figure") -> None:
@@ -141,6 +165,65 @@ POSITION_COLOR_MAP = {
     "right": (0, 1, 0, 0.7),
 }
 TARGET_BAR_COLOR = (0, 0, 1, 0.85)  # Blue highlight for target bar
+# Below this many gaze points a density mode is noise; ellipses fall back to the mean
+MIN_DENSITY_POINTS = 30
+# Above this many gaze points a montage panel is saturated; extra markers only cost render time
+SCATTER_MAX_POINTS = 2000
+# Integer codes used by the vectorized position classifier (index order = Left/Center/Right)
+POSITION_CODES = {"left": 0, "center": 1, "right": 2}
+POSITION_LABELS = ("left", "center", "right")
+# Compass sectors for trajectory segments: bin i of np.digitize(angle, edges, right=True)
+# covers (edges[i-1], edges[i]] degrees; both ends of the range wrap around to West
+DIRECTION_EDGES = (-157.5, -112.5, -67.5, -22.5, 22.5, 67.5, 112.5, 157.5)
+DIRECTION_LABELS = ("W", "SW", "S", "SE", "E", "NE", "N", "NW", "W")
+# Trajectory segment colors (RGBA); each diagonal is the mean of its two cardinals
+DIRECTION_COLORS = {
+    "N": (0, 0, 1, 0.85),
+    "S": (1, 0, 0, 0.85),
+    "E": (0, 1, 0, 0.85),
+    "W": (1, 0.5, 0, 0.85),
+}
+DIRECTION_COLORS.update(
+    {
+        f"{vertical}{horizontal}": tuple(
+            (a + b) / 2
+            for a, b in zip(DIRECTION_COLORS[vertical], DIRECTION_COLORS[horizontal])
+        )
+        for vertical, horizontal in (("N", "E"), ("N", "W"), ("S", "E"), ("S", "W"))
+    }
+)
+# Inputs at least this large are streamed with ijson rather than parsed whole (same
+# threshold as analyze_gaze_heatmaps.py)
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+# Spacing tight_layout() settles on for the 8x5 scatter montage (axes off, 6 pt titles);
+# applying it directly skips the per-run text-extent layout pass (top/bottom are
+# rescaled for other row counts)
+SCATTER_MONTAGE_LAYOUT = {
+    "left": 0.014286,
+    "right": 0.985714,
+    "top": 0.962083,
+    "bottom": 0.01875,
+    "wspace": 0.078125,
+    "hspace": 0.447449,
+}
+# zlib level 1 encodes the 40-panel grid PNGs about twice as fast as the default
+# level for ~15% larger files with identical pixels
+GRID_PNG_KWARGS = {"pil_kwargs": {"compress_level": 1}}
+# Shared styling for the per-trial bar/time grids, applied once through rcParams
+# instead of per-axis setter calls on every panel
+DARK_GRID_RC = {
+    "axes.facecolor": "black",
+    "axes.edgecolor": "white",
+    "axes.spines.top": False,
+    "axes.spines.right": False,
+    "xtick.color": "white",
+    "ytick.color": "white",
+    "xtick.labelsize": 6,
+    "ytick.labelsize": 6,
+}
+# Category and hue order of the combined violin plot; the jittered dots reuse them
+TYPE_ORDER = ["Type 2", "Type 1"]
+HUE_ORDER = ["Target", "Non_target"]
 
 
 # Position legend helper removed (legend creation now in-place where needed).
@@ -149,26 +232,27 @@ TARGET_BAR_COLOR = (0, 0, 1, 0.85)  # Blue highlight for target bar
 # Removed aggregate_position_times (no longer used after position summary removal).
 
 
-def get_trial_target_position(trial: Dict[str, Any]) -> str | None:
+def split_trial_positions(
+    trial: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    Return target spatial position for a trial if present.
+    Split a trial's position entries into target and foil (non-target) lists in one pass.
 
     Parameters
     ----------
     trial : dict
-        Trial dictionary containing a 'positions' list of objects with
-        keys 'position' (left|center|right) and 'isTarget' (bool).
+        Trial dictionary containing a 'positions' list.
 
     Returns
     -------
-    str | None
-        'left', 'center', or 'right' if a target exists; otherwise None.
+    tuple[list[dict], list[dict]]
+        (target entries, foil entries), each in original order.
     """
-    positions = trial.get("positions", [])
-    for entry in positions:
-        if entry.get("isTarget"):
-            return entry.get("position")
-    return None
+    target_positions: List[Dict[str, Any]] = []
+    foil_positions: List[Dict[str, Any]] = []
+    for entry in trial.get("positions", []):
+        (target_positions if entry.get("isTarget") else foil_positions).append(entry)
+    return target_positions, foil_positions
 
 
 import matplotlib.pyplot as plt
@@ -177,18 +261,108 @@ import pandas as pd
 import seaborn as sns
 
 
-def safe_kde(x_coords: List[float], y_coords: List[float]):
+def density_peak(
+    x_coords: List[float], y_coords: List[float], bins: int = 100
+) -> Tuple[float, float] | None:
     """
-    Safely compute a gaussian KDE. Returns None if KDE cannot be computed.
-    Falls back to using simple min/max and mean-based center if insufficient data.
+    Locate the point of highest gaze density using an FFT-smoothed 2D histogram.
+
+    Approximates the argmax of a Gaussian KDE (Scott bandwidth, per axis) evaluated on a
+    bins x bins grid, but the cost depends on the grid size rather than the number of
+    gaze points. Returns None if there are too few points (< MIN_DENSITY_POINTS) for a
+    meaningful estimate, or if either axis is constant (no histogram or convolution is
+    built; the mean is the exact answer there).
     """
-    try:
-        if len(x_coords) < 5:
-            raise ValueError("Insufficient points (<5) for KDE")
-        return gaussian_kde([x_coords, y_coords])
-    except Exception as e:
-        print(f"[WARN] safe_kde fallback engaged: {e}")
+    if len(x_coords) < MIN_DENSITY_POINTS:
+        return None
+    x_arr = np.asarray(x_coords)
+    y_arr = np.asarray(y_coords)
+    if np.ptp(x_arr) == 0 or np.ptp(y_arr) == 0:
         return None
+    hist, x_edges, y_edges = np.histogram2d(x_arr, y_arr, bins=bins)
+
+    # Scott's rule bandwidth expressed in bin units, one Gaussian window per axis
+    scott = len(x_arr) ** (-1.0 / 6.0)
+    sigma_x = max(x_arr.std(ddof=1) * scott / (x_edges[1] - x_edges[0]), 0.5)
+    sigma_y = max(y_arr.std(ddof=1) * scott / (y_edges[1] - y_edges[0]), 0.5)
+    window_x = gaussian_window(2 * int(np.ceil(3 * sigma_x)) + 1, std=sigma_x)
+    window_y = gaussian_window(2 * int(np.ceil(3 * sigma_y)) + 1, std=sigma_y)
+    density = fftconvolve(hist, np.outer(window_x, window_y), mode="same")
+    ix, iy = np.unravel_index(np.argmax(density), density.shape)
+    center_x = 0.5 * (x_edges[ix] + x_edges[ix + 1])
+    center_y = 0.5 * (y_edges[iy] + y_edges[iy + 1])
+    return float(center_x), float(center_y)
+
+
+def kde_surface(
+    x_coords: np.ndarray, y_coords: np.ndarray, gridsize: int = 200, cut: float = 3
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    Evaluate a 2D Gaussian KDE (Scott bandwidth, full covariance) on a regular grid.
+
+    Uses the same support grid as seaborn.kdeplot (each axis spans min/max +/- cut
+    bandwidths in `gridsize` steps), but bins the points onto that grid and convolves
+    with the kernel via FFT instead of summing every kernel at every grid point.
+
+    Returns
+    -------
+    tuple or None
+        (x_grid, y_grid, density) with density shaped (len(y_grid), len(x_grid)) as
+        expected by contourf, or None if the data are singular (zero variance).
+    """
+    data = np.vstack([x_coords, y_coords]).astype(np.float64)
+    n_points = data.shape[1]
+    if n_points < 2 or np.isclose(data.var(axis=1, ddof=1).min(), 0):
+        return None
+    covariance = np.cov(data) * n_points ** (-2.0 / 6.0)
+    inv_covariance = np.linalg.inv(covariance)
+    bandwidth = np.sqrt(np.diag(covariance))
+
+    lo = data.min(axis=1) - cut * bandwidth
+    hi = data.max(axis=1) + cut * bandwidth
+    x_grid = np.linspace(lo[0], hi[0], gridsize)
+    y_grid = np.linspace(lo[1], hi[1], gridsize)
+    x_step = x_grid[1] - x_grid[0]
+    y_step = y_grid[1] - y_grid[0]
+    # Bins centered on the grid points; transpose so rows follow y as contourf expects
+    counts, _, _ = np.histogram2d(
+        data[0],
+        data[1],
+        bins=[
+            np.append(x_grid - x_step / 2, x_grid[-1] + x_step / 2),
+            np.append(y_grid - y_step / 2, y_grid[-1] + y_step / 2),
+        ],
+    )
+
+    # Kernel sampled on the same spacing out to 4 bandwidths (capped at the grid size)
+    half_x = min(int(np.ceil(4 * bandwidth[0] / x_step)), gridsize)
+    half_y = min(int(np.ceil(4 * bandwidth[1] / y_step)), gridsize)
+    dx, dy = np.meshgrid(
+        np.arange(-half_x, half_x + 1) * x_step, np.arange(-half_y, half_y + 1) * y_step
+    )
+    mahalanobis = (
+        inv_covariance[0, 0] * dx * dx
+        + 2 * inv_covariance[0, 1] * dx * dy
+        + inv_covariance[1, 1] * dy * dy
+    )
+    norm = 2 * np.pi * np.sqrt(np.linalg.det(covariance))
+    kernel = np.exp(-0.5 * mahalanobis) / norm
+    density = fftconvolve(counts.T, kernel, mode="same") / n_points
+    # FFT round-off can leave tiny negatives in empty regions
+    np.clip(density, 0, None, out=density)
+    return x_grid, y_grid, density
+
+
+def density_levels(density: np.ndarray, thresh: float, levels: int) -> np.ndarray:
+    """
+    Convert `levels` iso-proportions from `thresh` to 1 into density contour levels.
+
+    Matches seaborn.kdeplot: each level bounds the region holding that share of mass.
+    """
+    sorted_values = np.sort(density, axis=None)[::-1]
+    normalized_values = np.cumsum(sorted_values) / sorted_values.sum()
+    idx = np.searchsorted(normalized_values, 1 - np.linspace(thresh, 1, levels))
+    return np.take(sorted_values, idx, mode="clip")
 
 
 from matplotlib.legend_handler import HandlerTuple
@@ -196,7 +370,6 @@ from matplotlib.lines import Line2D
 from matplotlib.patches import Ellipse
 from matplotlib.patches import Rectangle
 from scipy.stats import f_oneway
-from scipy.stats import gaussian_kde
 from scipy.stats import levene
 from scipy.stats import shapiro
 from scipy.stats import ttest_ind
@@ -214,27 +387,19 @@ def generate_table(headers: List[str], data: List[List[Any]]) -> str:
     Returns:
         str: Formatted Markdown table string
     """
+    # Stringify every cell exactly once; widths and rendering both reuse str_rows
+    str_rows = [[str(cell) for cell in row] for row in [headers] + data]
     column_widths = [
-        max(len(str(item)) for item in col) for col in zip(*([headers] + data))
+        max(len(row[col]) for row in str_rows) for col in range(len(headers))
     ]
-    table = (
-        "| "
-        + " | ".join(
-            [header.ljust(width) for header, width in zip(headers, column_widths)]
-        )
-        + " |\n"
+    # One format spec per row, one join for the whole table (no repeated str +=)
+    row_format = "| " + " | ".join(f"{{:<{width}}}" for width in column_widths) + " |\n"
+    separator = "| " + " | ".join("-" * width for width in column_widths) + " |\n"
+    header_row, *body_rows = str_rows
+    return "".join(
+        [row_format.format(*header_row), separator]
+        + [row_format.format(*row) for row in body_rows]
     )
-    separator = "| " + " | ".join(["-" * width for width in column_widths]) + " |\n"
-    table += separator
-    for row in data:
-        table += (
-            "| "
-            + " | ".join(
-                [f"{str(cell).ljust(width)}" for cell, width in zip(row, column_widths)]
-            )
-            + " |\n"
-        )
-    return table
 
 
 def print_markdown_description(description: str) -> str:
@@ -294,7 +459,26 @@ def parse_arguments() -> argparse.Namespace:
 
 
 def load_json_data(json_file_path: str) -> dict:
-    """Load and return JSON data from file."""
+    """
+    Load and return JSON data from file.
+
+    Files are parsed whole with orjson when it is installed (standard library otherwise).
+    Files of STREAMING_THRESHOLD_BYTES or more are streamed with ijson if a compiled
+    ijson backend is available: only the "trialData" array is read, trial by trial,
+    and the top-level session "gazeData" duplicate (roughly half of a typical file)
+    is never materialized.
+    """
+    if (
+        ijson is not None
+        and os.path.getsize(json_file_path) >= STREAMING_THRESHOLD_BYTES
+    ):
+        with open(json_file_path, "rb") as file:
+            return {
+                "trialData": list(ijson.items(file, "trialData.item", use_float=True))
+            }
+    if orjson is not None:
+        with open(json_file_path, "rb") as file:
+            return orjson.loads(file.read())
     with open(json_file_path, "r") as file:
         return json.load(file)
 
@@ -309,15 +493,27 @@ def get_unique_folder_path(base_path: str) -> str:
     Returns:
         str: A unique folder path
     """
-    if not os.path.exists(base_path):
+    # One directory listing instead of an os.path.exists() probe per existing run
+    parent = os.path.dirname(base_path) or "."
+    name = os.path.basename(base_path)
+    try:
+        with os.scandir(parent) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        return base_path
+    if name not in existing:
         return base_path
 
+    numbered = re.compile(re.escape(name) + r"\((\d+)\)")
+    used = {
+        int(match.group(1))
+        for match in map(numbered.fullmatch, existing)
+        if match is not None
+    }
     counter = 1
-    while True:
-        numbered_path = f"{base_path}({counter})"
-        if not os.path.exists(numbered_path):
-            return numbered_path
+    while counter in used:
         counter += 1
+    return f"{base_path}({counter})"
 
 
 def setup_output_directory(json_file_path: str) -> Tuple[str, str]:
@@ -330,33 +526,139 @@ def setup_output_directory(json_file_path: str) -> Tuple[str, str]:
 
     os.makedirs(output_folder, exist_ok=True)
 
-    # Copy the JSON file to the output folder
+    # Copy the JSON file to the output folder (a real copy, so the archived input
+    # stays a snapshot even if the source is edited later)
     json_destination = os.path.join(output_folder, os.path.basename(json_file_path))
     shutil.copy2(json_file_path, json_destination)
     return output_folder, json_file_name
 
 
+def classify_positions(xs: np.ndarray) -> np.ndarray:
+    """
+    Determine the screen position of every x-coordinate in one branchless pass.
+
+    Args:
+        xs: Array of X-coordinate values
+
+    Returns:
+        np.ndarray: int8 position codes (see POSITION_CODES): 0 = left (x < 0),
+        1 = center (0 < x < 1000), 2 = right (x == 0, x >= 1000, or NaN)
+    """
+    # Adjust the 1000 boundary based on screen dimensions
+    return 2 - (xs < 1000).astype(np.int8) - (xs < 0) + (xs == 0)
+
+
+def classify_directions(dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+    """
+    Assign every gaze segment (dx, dy) to one of eight compass directions at once.
+
+    Args:
+        dx: Array of X displacements between consecutive gaze points
+        dy: Array of Y displacements between consecutive gaze points
+
+    Returns:
+        np.ndarray: Indices into DIRECTION_LABELS; sectors are 45 degrees wide, centered
+        on E (0 degrees), NE, N, ... and closed on their counter-clockwise edge.
+        Undefined angles (NaN displacements) count as E.
+    """
+    angle = np.degrees(np.arctan2(dy, dx))
+    codes = np.digitize(angle, DIRECTION_EDGES, right=True)
+    codes[np.isnan(angle)] = DIRECTION_LABELS.index("E")
+    return codes
+
+
 def determine_position(x: float) -> str:
     """
     Determine the screen position based on x-coordinate.
 
+    Kept for callers that classify a single sample; array code should use
+    classify_positions.
+
     Args:
         x: X-coordinate value
 
     Returns:
         str: Position category ('left', 'center', or 'right')
     """
-    if x < 0:
-        return "left"
-    elif x > 0 and x < 1000:  # Adjust based on screen dimensions
-        return "center"
-    else:
-        return "right"
+    return POSITION_LABELS[int(classify_positions(np.asarray(x, dtype=np.float64)))]
+
+
+class TrialRecord(NamedTuple):
+    """Per-trial gaze arrays and position aggregates, built once by preprocess_trials."""
+
+    xs: np.ndarray
+    ys: np.ndarray
+    times: np.ndarray
+    counts: np.ndarray
+    time_sums: np.ndarray
+    target_position: str | None
+    non_target_position: str | None
+    foil_positions: Tuple[str | None, ...]
+
+
+def preprocess_trials(trial_data: List[Dict[str, Any]]) -> List[TrialRecord]:
+    """
+    Walk every trial's gaze samples exactly once and keep the results as arrays.
+
+    Args:
+        trial_data: List of trial dictionaries (see process_trial_data)
+
+    Returns:
+        List[TrialRecord]: One record per trial, in trial order. Missing "x"/"y"/"time"
+        values default to 0.0 and None samples are dropped. `counts` and `time_sums`
+        are indexed by POSITION_CODES. The target and foil position labels are
+        resolved here too, so later passes never rescan a trial's "positions".
+    """
+    records = []
+    for trial in trial_data:
+        samples = np.array(
+            [
+                (pt.get("x", 0.0), pt.get("y", 0.0), pt.get("time", 0.0))
+                for pt in (trial.get("gazeData", []) or [])
+                if pt is not None
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        xs, ys, times = samples.T
+        codes = classify_positions(xs)
+        target_positions, foil_positions = split_trial_positions(trial)
+        foil_labels = tuple(entry.get("position") for entry in foil_positions)
+        records.append(
+            TrialRecord(
+                xs=xs,
+                ys=ys,
+                times=times,
+                counts=np.bincount(codes, minlength=3),
+                time_sums=np.bincount(codes, weights=times, minlength=3),
+                target_position=(
+                    target_positions[0].get("position") if target_positions else None
+                ),
+                non_target_position=foil_labels[0] if foil_labels else None,
+                foil_positions=foil_labels,
+            )
+        )
+    return records
+
+
+def position_total(totals: np.ndarray, position: str | None) -> float:
+    """
+    Look up a per-position total (see TrialRecord.counts / time_sums) by label.
+
+    Args:
+        totals: Array indexed by POSITION_CODES
+        position: 'left', 'center', 'right', or anything else (e.g. None)
+
+    Returns:
+        The total at that position, or 0 for unknown labels
+    """
+    code = POSITION_CODES.get(position)
+    return 0 if code is None else totals[code]
 
 
 def process_trial_data(
     trial_data: List[Dict[str, Any]],
-) -> Dict[str, Dict[str, List[float]]]:
+    records: List[TrialRecord] | None = None,
+) -> Dict[str, Dict[str, np.ndarray]]:
     """
     Convert raw trial gaze data into target/non-target percentage summaries per trial type.
 
@@ -367,109 +669,155 @@ def process_trial_data(
         - "type": str
         - "gazeData": list of { "x": float, "y": float, "time": float }
         - "positions": list of { "position": str, "isTarget": bool }
+    records : list[TrialRecord], optional
+        Output of preprocess_trials(trial_data); computed here when omitted.
 
     Returns
     -------
     dict
-        Nested dict: { trial_type: { "target": [percentages], "non_target": [percentages] } }.
-        Percentages are (count of gaze samples at target/non-target position) / total samples * 100.
+        Nested dict: { trial_type: { "target": ndarray, "non_target": ndarray } } of
+        float64 percentages in trial order. Percentages are (count of gaze samples at
+        target/non-target position) / total samples * 100.
     """
-    types_data: Dict[str, Dict[str, List[float]]] = {
-        "1": {"target": [], "non_target": []},
-        "2": {"target": [], "non_target": []},
+    if records is None:
+        records = preprocess_trials(trial_data)
+
+    # No type can hold more than every trial: fill preallocated buffers by index
+    # and trim to the filled length at the end
+    n_trials = len(trial_data)
+    buffers = {
+        trial_type: {"target": np.empty(n_trials), "non_target": np.empty(n_trials)}
+        for trial_type in ("1", "2")
     }
+    filled = {trial_type: {"target": 0, "non_target": 0} for trial_type in buffers}
 
-    for trial in trial_data:
+    for trial, record in zip(trial_data, records):
         trial_type = trial.get("type")
-        gaze_data = trial.get("gazeData", [])
-        if not gaze_data or trial_type not in types_data:
+        total_samples = len(record.xs)
+        if total_samples == 0 or trial_type not in buffers:
             continue
 
-        positions = trial.get("positions", [])
-        target_pos = next((p["position"] for p in positions if p.get("isTarget")), None)
-        non_target_pos = next(
-            (p["position"] for p in positions if not p.get("isTarget")), None
-        )
+        target_pos = record.target_position
+        non_target_pos = record.non_target_position
+        position_counts = record.counts
+
+        # Percentage of samples at the target and at the first non-target position
+        for status, position in (
+            ("target", target_pos),
+            ("non_target", non_target_pos),
+        ):
+            if position:
+                count = int(position_total(position_counts, position))
+                index = filled[trial_type][status]
+                buffers[trial_type][status][index] = count / total_samples * 100.0
+                filled[trial_type][status] = index + 1
 
-        total_samples = len(gaze_data)
-        if total_samples == 0:
-            continue
+    return {
+        trial_type: {
+            status: buffer[: filled[trial_type][status]]
+            for status, buffer in type_buffers.items()
+        }
+        for trial_type, type_buffers in buffers.items()
+    }
 
-        # Count samples at target position
-        if target_pos:
-            target_count = sum(
-                1
-                for g in gaze_data
-                if determine_position(g.get("x", 0.0)) == target_pos
-            )
-            types_data[trial_type]["target"].append(
-                target_count / total_samples * 100.0
-            )
 
-        # Count samples at first non-target position
-        if non_target_pos:
-            non_target_count = sum(
-                1
-                for g in gaze_data
-                if determine_position(g.get("x", 0.0)) == non_target_pos
-            )
-            types_data[trial_type]["non_target"].append(
-                non_target_count / total_samples * 100.0
-            )
+def compute_scatter_geometry(record: TrialRecord):
+    """
+    Compute the numeric content of one scatter-montage panel (no plotting).
 
-    return types_data
+    Parameters
+    ----------
+    record : TrialRecord
+        Preprocessed gaze arrays for a single trial.
+
+    Returns
+    -------
+    tuple or None
+        (x_coords, y_coords, (x_min, x_max, y_min, y_max), (center_x, center_y),
+        (semi_major_axis, semi_minor_axis)), or None when the trial has no samples.
+    """
+    if not len(record.xs):
+        return None
+    # Pixel coordinates: float32 is ample and halves the bytes fed to
+    # scatter / histogram2d / fftconvolve
+    x_coords = record.xs.astype(np.float32)
+    y_coords = record.ys.astype(np.float32)
+
+    x_min, x_max = float(x_coords.min()), float(x_coords.max())
+    y_min, y_max = float(y_coords.min()), float(y_coords.max())
+
+    # Determine center via smoothed density peak if possible, otherwise mean
+    try:
+        peak = density_peak(x_coords, y_coords)
+    except Exception as e:
+        print(f"[WARN] Density peak estimation failed in scatter plot: {e}")
+        peak = None
+    if peak is not None:
+        center_x, center_y = peak
+    else:
+        center_x = float(np.mean(x_coords))
+        center_y = float(np.mean(y_coords))
+
+    semi_major_axis = (x_max - x_min) / 3 if x_max != x_min else 1
+    semi_minor_axis = (y_max - y_min) / 3 if y_max != y_min else 1
+
+    return (
+        x_coords,
+        y_coords,
+        (x_min, x_max, y_min, y_max),
+        (center_x, center_y),
+        (semi_major_axis, semi_minor_axis),
+    )
 
 
-def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
+def create_scatter_plots(
+    trial_data: List[dict],
+    output_folder: str,
+    records: List[TrialRecord] | None = None,
+) -> str:
     """Create and save scatter plots (robust to KDE failures)."""
     print("[INFO] Generating scatter_plots.png")
     try:
-        fig, axes = plt.subplots(8, 5, figsize=(10.5, 8), dpi=100)
-        axes = axes.flatten()
+        # One panel per trial: short sessions no longer allocate and draw a full 8x5 grid
+        fig, axes, rows, _ = create_dynamic_grid(
+            len(trial_data), cols=5, base_width=10.5, base_height=8.0, dpi=100
+        )
 
         for ax in axes:
             ax.set_facecolor("black")
 
-        for i, trial in enumerate(trial_data):
-            if i >= len(axes):
-                break
-            gaze_data = trial.get("gazeData", [])
-            if not gaze_data:
-                continue
-            x_coords = [point["x"] for point in gaze_data]
-            y_coords = [point["y"] for point in gaze_data]
+        # Per-trial geometry is pure NumPy/SciPy (which release the GIL), so it is
+        # computed concurrently; every matplotlib call stays on this thread
+        if records is None:
+            records = preprocess_trials(trial_data)
+        with ThreadPoolExecutor() as executor:
+            geometries = list(executor.map(compute_scatter_geometry, records))
 
-            if not x_coords or not y_coords:
+        for i, (trial, geometry) in enumerate(zip(trial_data, geometries)):
+            if geometry is None:
                 continue
-
-            x_min, x_max = min(x_coords), max(x_coords)
-            y_min, y_max = min(y_coords), max(y_coords)
-
-            # Determine center via KDE if possible, otherwise mean
-            kde = safe_kde(x_coords, y_coords)
-            if kde:
-                try:
-                    x_grid, y_grid = np.mgrid[x_min:x_max:100j, y_min:y_max:100j]
-                    density = kde(np.vstack([x_grid.flatten(), y_grid.flatten()]))
-                    density_reshaped = density.reshape(x_grid.shape)
-                    max_density_index = np.unravel_index(
-                        np.argmax(density_reshaped), density_reshaped.shape
-                    )
-                    center_x = x_grid[max_density_index]
-                    center_y = y_grid[max_density_index]
-                except Exception as e:
-                    print(f"[WARN] KDE evaluation failed in scatter plot: {e}")
-                    center_x = float(np.mean(x_coords))
-                    center_y = float(np.mean(y_coords))
-            else:
-                center_x = float(np.mean(x_coords))
-                center_y = float(np.mean(y_coords))
-
-            semi_major_axis = (x_max - x_min) / 3 if x_max != x_min else 1
-            semi_minor_axis = (y_max - y_min) / 3 if y_max != y_min else 1
+            (
+                x_coords,
+                y_coords,
+                (x_min, x_max, y_min, y_max),
+                (center_x, center_y),
+                (semi_major_axis, semi_minor_axis),
+            ) = geometry
+
+            # Very dense trials are drawn from a fixed-seed subsample; bounds and the
+            # density peak above still use every sample
+            if len(x_coords) > SCATTER_MAX_POINTS:
+                keep = np.random.default_rng(0).choice(
+                    len(x_coords), SCATTER_MAX_POINTS, replace=False
+                )
+                x_coords, y_coords = x_coords[keep], y_coords[keep]
 
             axes[i].scatter(x_coords, y_coords, c="yellow", alpha=0.75, s=10)
 
+            # Outlines are collected and added as one PatchCollection per panel;
+            # add_patch() recomputes the data limits from every patch's Bezier path
+            outlines = []
+
             # Draw the panel/view outline (thin white rectangle)
             try:
                 view_rect = Rectangle(
@@ -481,7 +829,7 @@ def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
                     fill=False,
                     zorder=3,
                 )
-                axes[i].add_patch(view_rect)
+                outlines.append(view_rect)
             except Exception:
                 # ignore if bounding box cannot be drawn
                 pass
@@ -533,7 +881,7 @@ def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
                             linewidth=2,
                             zorder=4,
                         )
-                        axes[i].add_patch(red_ellipse)
+                        outlines.append(red_ellipse)
                         target_drawn = True
                         break
                     except Exception:
@@ -551,7 +899,7 @@ def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
                     linewidth=2,
                     zorder=2.5,
                 )
-                axes[i].add_patch(ellipse)
+                outlines.append(ellipse)
 
             # Draw white ovals for the other objects (non-targets)
             for pos_entry in positions:
@@ -573,10 +921,20 @@ def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
                         alpha=0.9,
                         zorder=3.5,
                     )
-                    axes[i].add_patch(white_ellipse)
+                    outlines.append(white_ellipse)
                 except Exception:
                     continue
 
+            # Sorting by each patch's zorder keeps the original stacking inside the
+            # collection; all outlines still sit above the scatter markers
+            axes[i].add_collection(
+                PatchCollection(
+                    sorted(outlines, key=lambda patch: patch.get_zorder()),
+                    match_original=True,
+                    zorder=3,
+                )
+            )
+
             axes[i].set_title(
                 f"Trial {trial.get('trialNumber', '?')}, Type {trial.get('type', '?')}",
                 fontsize=6,
@@ -584,9 +942,19 @@ def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
             )
             axes[i].axis("off")
 
-        plt.tight_layout()
+        # The figure height scales with the row count, so keep the top/bottom margins
+        # at the 8-row montage's absolute size (room for the first row's titles)
+        margin_scale = 8.0 / rows
+        fig.subplots_adjust(
+            **{
+                **SCATTER_MONTAGE_LAYOUT,
+                "top": 1 - (1 - SCATTER_MONTAGE_LAYOUT["top"]) * margin_scale,
+                "bottom": SCATTER_MONTAGE_LAYOUT["bottom"] * margin_scale,
+            }
+        )
         scatter_plot_path = os.path.join(output_folder, "scatter_plots.png")
-        plt.savefig(scatter_plot_path, facecolor="black")
+        fig.savefig(scatter_plot_path, facecolor="black", **GRID_PNG_KWARGS)
+        plt.close(fig)
         print(f"[INFO] Saved scatter plots to {scatter_plot_path}")
         return scatter_plot_path
     except Exception as e:
@@ -606,40 +974,34 @@ def create_scatter_plots(trial_data: List[dict], output_folder: str) -> str:
         return fallback_path
 
 
-def create_trial_percentage_plots(trial_data: List[dict], output_folder: str) -> str:
+@matplotlib.rc_context(DARK_GRID_RC)
+def create_trial_percentage_plots(
+    trial_data: List[dict],
+    output_folder: str,
+    records: List[TrialRecord] | None = None,
+) -> str:
     """
     Create per-trial plots showing % time for Left / Center / Right with target highlight (dynamic grid).
-    If individual foil positions are unavailable (e.g., fewer than 2 non-target positions),
-    the combined non-target time is evenly divided and labeled as scaled.
     """
     print("[INFO] Generating trial_percentage_plots.png")
     try:
         fig, axes, _, _ = create_dynamic_grid(
             len(trial_data), cols=5, base_width=10.5, base_height=8.0, dpi=100
         )
-        for ax in axes:
-            ax.set_facecolor("black")
 
-        for i, trial in enumerate(trial_data):
+        if records is None:
+            records = preprocess_trials(trial_data)
+        for i, (trial, record) in enumerate(zip(trial_data, records)):
             if i >= len(axes):
                 break
-            gaze_data = trial.get("gazeData", [])
-            if not gaze_data:
+            if not len(record.xs):
+                axes[i].axis("off")
                 continue
 
-            positions = trial.get("positions", [])
-            target_positions = [p for p in positions if p.get("isTarget")]
-            foil_positions = [p for p in positions if not p.get("isTarget")]
-
-            target_pos = target_positions[0]["position"] if target_positions else None
-            foil1_pos = (
-                foil_positions[0]["position"] if len(foil_positions) > 0 else None
-            )
-            foil2_pos = (
-                foil_positions[1]["position"] if len(foil_positions) > 1 else None
-            )
+            target_pos = record.target_position
 
-            total_time = sum(pt.get("time", 0.0) for pt in gaze_data)
+            position_times = record.time_sums
+            total_time = float(position_times.sum())
             if total_time <= 0:
                 axes[i].text(
                     0.5,
@@ -659,93 +1021,8 @@ def create_trial_percentage_plots(trial_data: List[dict], output_folder: str) ->
                 axes[i].axis("off")
                 continue
 
-            def time_for_position(pos):
-                if not pos:
-                    return 0.0
-                return sum(
-                    pt.get("time", 0.0)
-                    for pt in gaze_data
-                    if determine_position(pt.get("x", 0.0)) == pos
-                )
-
-            target_time = time_for_position(target_pos)
-            foil1_time = time_for_position(foil1_pos)
-            foil2_time = time_for_position(foil2_pos)
-
-            scaled = False
-            # If we do not have two distinct foils, scale the combined non-target time
-            if foil1_pos is None or foil2_pos is None:
-                combined_non_target_time = total_time - target_time
-                foil1_time = combined_non_target_time / 2.0
-                foil2_time = combined_non_target_time / 2.0
-                scaled = True
-
-            # Convert to percentages
-            if total_time > 0:
-                # target_pct unused in reordered logic (removed)
-                # foil1_pct unused in reordered logic (removed)
-                # foil2_pct unused in reordered logic (removed)
-                pass  # explicit no-op after removing legacy percentage variables
-            else:
-                # explicit else to satisfy block structure after refactor
-                pass
-            # (Removed unused percentage variables for target/foils.)
-
-            # Build foil labels based on their screen positions (left/center/right)
-            # Exclude the target position from foil labeling
-            position_label_map = {
-                "left": "Foil Left",
-                "center": "Foil Center",
-                "right": "Foil Right",
-            }
-            foil_times = {}
-            if not scaled:
-                # Use actual foil positions
-                if foil1_pos:
-                    foil_times[foil1_pos] = foil1_time
-                if foil2_pos:
-                    foil_times[foil2_pos] = foil2_time
-            else:
-                # Scaled case: split combined non-target between two generic foil placeholders
-                # Choose two foil position labels not equal to target (priority order: left, center, right)
-                candidate_positions = [
-                    p for p in ["left", "center", "right"] if p != target_pos
-                ]
-                if len(candidate_positions) >= 2:
-                    foil_times[candidate_positions[0]] = foil1_time
-                    foil_times[candidate_positions[1]] = foil2_time
-                elif len(candidate_positions) == 1:
-                    # Only one position available, duplicate with scaled tag
-                    foil_times[candidate_positions[0]] = foil1_time + foil2_time
-            # Order foils by spatial priority left -> center -> right
-            ordered_foils = [
-                p
-                for p in ["left", "center", "right"]
-                if p in foil_times and p != target_pos
-            ]
-            # Ensure we have at most two foil entries
-            ordered_foils = ordered_foils[:2]
-            # Prepare labels and values
-            foil_labels = []
-            foil_values = []
-            for p in ordered_foils:
-                base_label = position_label_map.get(p, "Foil")
-                if scaled:
-                    base_label += " (Scaled)"
-                foil_labels.append(base_label)
-                foil_values.append(
-                    (foil_times[p] / total_time * 100.0) if total_time > 0 else 0.0
-                )
-            # If fewer than 2 foils after processing (edge case), pad with zeros
-            while len(foil_labels) < 2:
-                filler_label = "Foil (Scaled)" if scaled else "Foil"
-                foil_labels.append(filler_label)
-                foil_values.append(0.0)
-            # (Removed unused target_label variable.)
-            # Reworked: enforce Left / Center / Right ordering with target highlight
-            left_time = time_for_position("left")
-            center_time = time_for_position("center")
-            right_time = time_for_position("right")
+            # Left / Center / Right ordering with target highlight
+            left_time, center_time, right_time = position_times.tolist()
             if total_time > 0:
                 left_pct = left_time / total_time * 100.0
                 center_pct = center_time / total_time * 100.0
@@ -754,16 +1031,12 @@ def create_trial_percentage_plots(trial_data: List[dict], output_folder: str) ->
                 left_pct = center_pct = right_pct = 0.0
             labels = ["Left", "Center", "Right"]
             values = [left_pct, center_pct, right_pct]
-            base_color_map = {
-                "Left": (1, 0.5, 0, 0.7),
-                "Center": (0.7, 0.7, 0.7, 0.7),
-                "Right": (0, 1, 0, 0.7),
-            }
-            target_color = (0, 0, 1, 0.85)
             colors = [
-                target_color
-                if lbl.lower() == (target_pos or "")
-                else base_color_map[lbl]
+                (
+                    TARGET_BAR_COLOR
+                    if lbl.lower() == (target_pos or "")
+                    else POSITION_COLOR_MAP[lbl.lower()]
+                )
                 for lbl in labels
             ]
             bars = axes[i].bar(labels, values, color=colors)
@@ -774,7 +1047,7 @@ def create_trial_percentage_plots(trial_data: List[dict], output_folder: str) ->
                 color="white",
             )
 
-            for bar, val, lbl in zip(bars, values, labels):
+            for bar, val in zip(bars, values):
                 axes[i].text(
                     bar.get_x() + bar.get_width() / 2,
                     bar.get_height() + 1,
@@ -784,29 +1057,12 @@ def create_trial_percentage_plots(trial_data: List[dict], output_folder: str) ->
                     fontsize=6,
                     color="white",
                 )
-                if lbl == "Target":
-                    axes[i].text(
-                        bar.get_x() + bar.get_width() / 2,
-                        bar.get_height() + 4,
-                        "Target",
-                        ha="center",
-                        va="bottom",
-                        fontsize=6,
-                        color="cyan",
-                    )
-
-            axes[i].tick_params(axis="x", colors="white", labelsize=6)
-            axes[i].tick_params(axis="y", colors="white", labelsize=6)
-            axes[i].spines["bottom"].set_color("white")
-            axes[i].spines["left"].set_color("white")
-            axes[i].spines["top"].set_visible(False)
-            axes[i].spines["right"].set_visible(False)
 
         plt.tight_layout()
         # Position legend
         build_position_legend(fig)
         percentage_plot_path = os.path.join(output_folder, "trial_percentage_plots.png")
-        plt.savefig(percentage_plot_path, facecolor="black")
+        plt.savefig(percentage_plot_path, facecolor="black", **GRID_PNG_KWARGS)
         print(f"[INFO] Saved trial percentage plots to {percentage_plot_path}")
     except Exception as e:
         print(f"[ERROR] Failed to generate trial percentage plots: {e}")
@@ -827,112 +1083,44 @@ def create_trial_percentage_plots(trial_data: List[dict], output_folder: str) ->
     return percentage_plot_path
 
 
-def create_trial_count_plots(trial_data: List[dict], output_folder: str) -> str:
+@matplotlib.rc_context(DARK_GRID_RC)
+def create_trial_count_plots(
+    trial_data: List[dict],
+    output_folder: str,
+    records: List[TrialRecord] | None = None,
+) -> str:
     """
     Create per-trial plots showing number of observations for Left / Center / Right with target highlight (dynamic grid).
-    If individual foils cannot be distinguished (fewer than 2 non-target position entries),
-    the combined non-target count is evenly divided and labeled as scaled.
     """
     print("[INFO] Generating trial_count_plots.png")
     try:
         fig, axes, _, _ = create_dynamic_grid(
             len(trial_data), cols=5, base_width=10.5, base_height=8.0, dpi=100
         )
-        for ax in axes:
-            ax.set_facecolor("black")
 
-        for i, trial in enumerate(trial_data):
+        if records is None:
+            records = preprocess_trials(trial_data)
+        for i, (trial, record) in enumerate(zip(trial_data, records)):
             if i >= len(axes):
                 break
-            gaze_data = trial.get("gazeData", [])
-            if not gaze_data:
+            if not len(record.xs):
+                axes[i].axis("off")
                 continue
 
-            positions = trial.get("positions", [])
-            target_positions = [p for p in positions if p.get("isTarget")]
-            foil_positions = [p for p in positions if not p.get("isTarget")]
+            target_pos = record.target_position
 
-            target_pos = target_positions[0]["position"] if target_positions else None
-            foil1_pos = (
-                foil_positions[0]["position"] if len(foil_positions) > 0 else None
-            )
-            foil2_pos = (
-                foil_positions[1]["position"] if len(foil_positions) > 1 else None
-            )
-
-            def count_for_position(pos):
-                if not pos:
-                    return 0
-                return sum(
-                    1 for pt in gaze_data if determine_position(pt.get("x", 0.0)) == pos
-                )
+            position_counts = record.counts
 
-            target_count = count_for_position(target_pos)
-            foil1_count = count_for_position(foil1_pos)
-            foil2_count = count_for_position(foil2_pos)
-
-            scaled = False
-            if foil1_pos is None or foil2_pos is None:
-                combined_non_target = len(gaze_data) - target_count
-                foil1_count = combined_non_target // 2
-                foil2_count = combined_non_target - foil1_count
-                scaled = True
-
-            # Build foil labels for counts based on screen positions
-            position_label_map = {
-                "left": "Foil Left",
-                "center": "Foil Center",
-                "right": "Foil Right",
-            }
-            foil_counts = {}
-            if not scaled:
-                if foil1_pos:
-                    foil_counts[foil1_pos] = foil1_count
-                if foil2_pos:
-                    foil_counts[foil2_pos] = foil2_count
-            else:
-                candidate_positions = [
-                    p for p in ["left", "center", "right"] if p != target_pos
-                ]
-                if len(candidate_positions) >= 2:
-                    foil_counts[candidate_positions[0]] = foil1_count
-                    foil_counts[candidate_positions[1]] = foil2_count
-                elif len(candidate_positions) == 1:
-                    foil_counts[candidate_positions[0]] = foil1_count + foil2_count
-            ordered_foils = [
-                p
-                for p in ["left", "center", "right"]
-                if p in foil_counts and p != target_pos
-            ]
-            ordered_foils = ordered_foils[:2]
-            foil_labels = []
-            foil_values = []
-            for p in ordered_foils:
-                base_label = position_label_map.get(p, "Foil")
-                if scaled:
-                    base_label += " (Scaled)"
-                foil_labels.append(base_label)
-                foil_values.append(foil_counts[p])
-            while len(foil_labels) < 2:
-                filler_label = "Foil (Scaled)" if scaled else "Foil"
-                foil_labels.append(filler_label)
-                foil_values.append(0)
             # Reworked: Left / Center / Right ordering with target highlight for counts
-            left_count = count_for_position("left")
-            center_count = count_for_position("center")
-            right_count = count_for_position("right")
+            left_count, center_count, right_count = position_counts.tolist()
             labels = ["Left", "Center", "Right"]
             values = [left_count, center_count, right_count]
-            base_color_map = {
-                "Left": (1, 0.5, 0, 0.7),
-                "Center": (0.7, 0.7, 0.7, 0.7),
-                "Right": (0, 1, 0, 0.7),
-            }
-            target_color = (0, 0, 1, 0.85)
             colors = [
-                target_color
-                if lbl.lower() == (target_pos or "")
-                else base_color_map[lbl]
+                (
+                    TARGET_BAR_COLOR
+                    if lbl.lower() == (target_pos or "")
+                    else POSITION_COLOR_MAP[lbl.lower()]
+                )
                 for lbl in labels
             ]
             bars = axes[i].bar(labels, values, color=colors)
@@ -941,10 +1129,10 @@ def create_trial_count_plots(trial_data: List[dict], output_folder: str) -> str:
                 fontsize=6,
                 color="white",
             )
-            max_val = max(values + [1])
+            max_val = max(*values, 1)
             axes[i].set_ylim(0, max_val * 1.15)
 
-            for bar, val, lbl in zip(bars, values, labels):
+            for bar, val in zip(bars, values):
                 axes[i].text(
                     bar.get_x() + bar.get_width() / 2,
                     bar.get_height() + (max_val * 0.02),
@@ -954,28 +1142,11 @@ def create_trial_count_plots(trial_data: List[dict], output_folder: str) -> str:
                     fontsize=6,
                     color="white",
                 )
-                if lbl == "Target":
-                    axes[i].text(
-                        bar.get_x() + bar.get_width() / 2,
-                        bar.get_height() + (max_val * 0.05),
-                        "Target",
-                        ha="center",
-                        va="bottom",
-                        fontsize=6,
-                        color="cyan",
-                    )
-
-            axes[i].tick_params(axis="x", colors="white", labelsize=6)
-            axes[i].tick_params(axis="y", colors="white", labelsize=6)
-            axes[i].spines["bottom"].set_color("white")
-            axes[i].spines["left"].set_color("white")
-            axes[i].spines["top"].set_visible(False)
-            axes[i].spines["right"].set_visible(False)
 
         plt.tight_layout()
         build_position_legend(fig)
         count_plot_path = os.path.join(output_folder, "trial_count_plots.png")
-        plt.savefig(count_plot_path, facecolor="black")
+        plt.savefig(count_plot_path, facecolor="black", **GRID_PNG_KWARGS)
         print(f"[INFO] Saved trial count plots to {count_plot_path}")
     except Exception as e:
         print(f"[ERROR] Failed to generate trial count plots: {e}")
@@ -991,7 +1162,11 @@ def create_trial_count_plots(trial_data: List[dict], output_folder: str) -> str:
     return count_plot_path
 
 
-def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
+def create_trajectory_plots(
+    trial_data: List[dict],
+    output_folder: str,
+    records: List[TrialRecord] | None = None,
+) -> str:
     """
     Create trajectory plots with vectors between consecutive gaze points,
     color-coded by direction (N, S, E, W, NE, NW, SE, SW).
@@ -999,69 +1174,47 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
     Robust to KDE or data issues; logs progress.
     """
     print("[INFO] Generating trajectory_plots.png")
-    # Colors (RGBA)
-    base_colors = {
-        "N": (0, 0, 1, 0.85),
-        "S": (1, 0, 0, 0.85),
-        "E": (0, 1, 0, 0.85),
-        "W": (1, 0.5, 0, 0.85),
-    }
-
-    def blend(c1, c2):
-        return tuple((c1[i] + c2[i]) / 2 for i in range(4))
-
-    direction_colors = {
-        "N": base_colors["N"],
-        "S": base_colors["S"],
-        "E": base_colors["E"],
-        "W": base_colors["W"],
-        "NE": blend(base_colors["N"], base_colors["E"]),
-        "NW": blend(base_colors["N"], base_colors["W"]),
-        "SE": blend(base_colors["S"], base_colors["E"]),
-        "SW": blend(base_colors["S"], base_colors["W"]),
-    }
+    # Row k is the color of DIRECTION_LABELS[k], so direction codes index it directly
+    direction_rgba = np.array([DIRECTION_COLORS[label] for label in DIRECTION_LABELS])
 
     fig, axes = plt.subplots(8, 5, figsize=(21, 16), dpi=100)  # doubled size
     axes = axes.flatten()
     for ax in axes:
         ax.set_facecolor("black")
 
-    def classify_direction(dx, dy):
-        angle = np.degrees(np.arctan2(dy, dx))
-        # Normalize angle to (-180,180]
-        if -22.5 < angle <= 22.5:
-            return "E"
-        if 22.5 < angle <= 67.5:
-            return "NE"
-        if 67.5 < angle <= 112.5:
-            return "N"
-        if 112.5 < angle <= 157.5:
-            return "NW"
-        if angle > 157.5 or angle <= -157.5:
-            return "W"
-        if -157.5 < angle <= -112.5:
-            return "SW"
-        if -112.5 < angle <= -67.5:
-            return "S"
-        if -67.5 < angle <= -22.5:
-            return "SE"
-        return "E"
-
-    for i, trial in enumerate(trial_data):
+    if records is None:
+        records = preprocess_trials(trial_data)
+
+    # Density peaks are independent per trial and pure NumPy/SciPy, so they are
+    # computed concurrently up front; all drawing below stays on this thread.
+    # As in the scatter montage, pixel coordinates go in as float32
+    with ThreadPoolExecutor() as executor:
+        peak_futures = [
+            executor.submit(
+                density_peak,
+                record.xs.astype(np.float32),
+                record.ys.astype(np.float32),
+            )
+            for record in records[: len(axes)]
+        ]
+
+    for i, (trial, record) in enumerate(zip(trial_data, records)):
         if i >= len(axes):
             break
-        gaze = trial.get("gazeData", [])
-        if len(gaze) < 2:
+        if len(record.xs) < 2:
             continue
-        x = [p["x"] for p in gaze]
-        y = [p["y"] for p in gaze]
+        x = record.xs
+        y = record.ys
 
-        x_min, x_max = min(x), max(x)
-        y_min, y_max = min(y), max(y)
+        x_min, x_max = float(x.min()), float(x.max())
+        y_min, y_max = float(y.min()), float(y.max())
 
         # Plot points
         axes[i].scatter(x, y, c="yellow", s=5, alpha=0.6)
 
+        # Outlines go into one PatchCollection per panel, as in the scatter montage
+        outlines = []
+
         # Draw panel view outline
         try:
             view_rect = Rectangle(
@@ -1073,22 +1226,15 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
                 fill=False,
                 zorder=3,
             )
-            axes[i].add_patch(view_rect)
+            outlines.append(view_rect)
         except Exception:
             pass
 
-        # Ellipse center via safe KDE fallback or target position if available
+        # Ellipse center via smoothed density peak, falling back to the mean
         try:
-            kde = safe_kde(x, y)
-            if kde:
-                x_grid, y_grid = np.mgrid[x_min:x_max:100j, y_min:y_max:100j]
-                density = kde(np.vstack([x_grid.flatten(), y_grid.flatten()]))
-                density_reshaped = density.reshape(x_grid.shape)
-                max_density_index = np.unravel_index(
-                    np.argmax(density_reshaped), density_reshaped.shape
-                )
-                center_x = x_grid[max_density_index]
-                center_y = y_grid[max_density_index]
+            peak = peak_futures[i].result()
+            if peak is not None:
+                center_x, center_y = peak
             else:
                 center_x = float(np.mean(x))
                 center_y = float(np.mean(y))
@@ -1140,7 +1286,7 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
                         linewidth=2,
                         zorder=4,
                     )
-                    axes[i].add_patch(red_ellipse)
+                    outlines.append(red_ellipse)
                     target_drawn = True
                     break
                 except Exception:
@@ -1157,7 +1303,7 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
                 linewidth=2,
                 zorder=2.5,
             )
-            axes[i].add_patch(red_ellipse)
+            outlines.append(red_ellipse)
 
         # Draw white ovals for other two objects
         for pos_entry in positions:
@@ -1177,19 +1323,32 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
                     alpha=0.9,
                     zorder=3.5,
                 )
-                axes[i].add_patch(white_ellipse)
+                outlines.append(white_ellipse)
             except Exception:
                 continue
 
-        # Vectors
-        for idx in range(len(gaze) - 1):
-            x1, y1 = x[idx], y[idx]
-            x2, y2 = x[idx + 1], y[idx + 1]
-            dx = x2 - x1
-            dy = y2 - y1
-            direction = classify_direction(dx, dy)
-            color = direction_colors[direction]
-            axes[i].plot([x1, x2], [y1, y2], color=color, linewidth=1, zorder=2)
+        axes[i].add_collection(
+            PatchCollection(
+                sorted(outlines, key=lambda patch: patch.get_zorder()),
+                match_original=True,
+                zorder=3,
+            )
+        )
+
+        # Vectors: every consecutive-point segment goes into one LineCollection per
+        # panel, (N, 2, 2) segments with an (N, 4) RGBA row per segment; projecting
+        # caps match the per-segment Line2D artists this replaces
+        points = np.column_stack([x, y])
+        direction_codes = classify_directions(np.diff(x), np.diff(y))
+        axes[i].add_collection(
+            LineCollection(
+                np.stack([points[:-1], points[1:]], axis=1),
+                colors=direction_rgba[direction_codes],
+                linewidths=1,
+                capstyle="projecting",
+                zorder=2,
+            )
+        )
 
         axes[i].set_title(
             f"Trial {trial.get('trialNumber', '?')} Trajectory",
@@ -1200,7 +1359,7 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
 
     # Construct legend manually
     legend_elements = [
-        Line2D([0], [0], color=direction_colors[d], lw=3, label=d)
+        Line2D([0], [0], color=DIRECTION_COLORS[d], lw=3, label=d)
         for d in ["N", "S", "E", "W", "NE", "NW", "SE", "SW"]
     ]
     fig.legend(
@@ -1215,7 +1374,7 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
     trajectory_plot_path = os.path.join(output_folder, "trajectory_plots.png")
     try:
         plt.tight_layout(rect=(0, 0.05, 1, 1))
-        plt.savefig(trajectory_plot_path, facecolor="black")
+        plt.savefig(trajectory_plot_path, facecolor="black", **GRID_PNG_KWARGS)
         print(f"[INFO] Saved trajectory plots to {trajectory_plot_path}")
     except Exception as e:
         print(f"[ERROR] Failed saving trajectory plots: {e}")
@@ -1232,7 +1391,12 @@ def create_trajectory_plots(trial_data: List[dict], output_folder: str) -> str:
     return trajectory_plot_path
 
 
-def create_trial_time_plots(trial_data: List[dict], output_folder: str) -> str:
+@matplotlib.rc_context(DARK_GRID_RC)
+def create_trial_time_plots(
+    trial_data: List[dict],
+    output_folder: str,
+    records: List[TrialRecord] | None = None,
+) -> str:
     """
     Create per-trial plots showing percentage of total time spent at Left, Center, and Right positions.
     Labels trials with 'Error' when total trial time is zero and continues processing.
@@ -1242,17 +1406,18 @@ def create_trial_time_plots(trial_data: List[dict], output_folder: str) -> str:
         fig, axes, _, _ = create_dynamic_grid(
             len(trial_data), cols=5, base_width=10.5, base_height=8.0, dpi=100
         )
-        for ax in axes:
-            ax.set_facecolor("black")
 
-        for i, trial in enumerate(trial_data):
+        if records is None:
+            records = preprocess_trials(trial_data)
+        for i, (trial, record) in enumerate(zip(trial_data, records)):
             if i >= len(axes):
                 break
-            gaze_data = trial.get("gazeData", [])
-            if not gaze_data:
+            if not len(record.xs):
+                axes[i].axis("off")
                 continue
 
-            total_time = sum(pt.get("time", 0.0) for pt in gaze_data)
+            position_times = record.time_sums
+            total_time = float(position_times.sum())
             if total_time <= 0:
                 axes[i].text(
                     0.5,
@@ -1273,34 +1438,25 @@ def create_trial_time_plots(trial_data: List[dict], output_folder: str) -> str:
                 continue
 
             # Aggregate time by screen position
-            pos_times = {"left": 0.0, "center": 0.0, "right": 0.0}
-            for pt in gaze_data:
-                pos = determine_position(pt.get("x", 0.0))
-                pos_times[pos] = pos_times.get(pos, 0.0) + pt.get("time", 0.0)
+            pos_times = {
+                pos: float(position_times[code]) for pos, code in POSITION_CODES.items()
+            }
 
             labels = ["Left", "Center", "Right"]
             # Identify target position for this trial (if available)
-            target_positions = [
-                p for p in trial.get("positions", []) if p.get("isTarget")
-            ]
-            target_pos = target_positions[0]["position"] if target_positions else None
+            target_pos = record.target_position
             values = [
                 (pos_times["left"] / total_time) * 100.0,
                 (pos_times["center"] / total_time) * 100.0,
                 (pos_times["right"] / total_time) * 100.0,
             ]
-            # Base (foil) color map by spatial position
-            base_color_map = {
-                "left": (1, 0.5, 0, 0.7),
-                "center": (0.7, 0.7, 0.7, 0.7),
-                "right": (0, 1, 0, 0.7),
-            }
-            target_color = (0, 0, 1, 0.85)
             # Assign colors: target bar always blue regardless of its spatial position
             colors = [
-                target_color
-                if lbl.lower() == target_pos
-                else base_color_map[lbl.lower()]
+                (
+                    TARGET_BAR_COLOR
+                    if lbl.lower() == target_pos
+                    else POSITION_COLOR_MAP[lbl.lower()]
+                )
                 for lbl in labels
             ]
 
@@ -1333,17 +1489,11 @@ def create_trial_time_plots(trial_data: List[dict], output_folder: str) -> str:
                     fontsize=6,
                     color="white",
                 )
-            axes[i].tick_params(axis="x", colors="white", labelsize=6)
-            axes[i].tick_params(axis="y", colors="white", labelsize=6)
-            axes[i].spines["bottom"].set_color("white")
-            axes[i].spines["left"].set_color("white")
-            axes[i].spines["top"].set_visible(False)
-            axes[i].spines["right"].set_visible(False)
 
         plt.tight_layout()
         build_position_legend(fig)
         time_plot_path = os.path.join(output_folder, "trial_time_plots.png")
-        plt.savefig(time_plot_path, facecolor="black")
+        plt.savefig(time_plot_path, facecolor="black", **GRID_PNG_KWARGS)
         print(f"[INFO] Saved trial time plots to {time_plot_path}")
     except Exception as e:
         print(f"[ERROR] Failed to generate trial time plots: {e}")
@@ -1360,40 +1510,49 @@ def create_trial_time_plots(trial_data: List[dict], output_folder: str) -> str:
 
 
 def create_combined_violin_plot(
-    types_data: Dict[str, Dict[str, List[float]]], output_folder: str
+    types_data: Dict[str, Dict[str, np.ndarray]], output_folder: str
 ) -> str:
     """Create a violin plot combining target and non-target gaze data."""
-    data_list = []
+    # Build the long-form frame column-wise rather than from one dict per sample
+    trial_type_cols = []
+    percentage_cols = []
+    status_cols = []
     for trial_type, type_data in types_data.items():
         for target_status, values in type_data.items():
-            data_list.extend(
-                [
-                    {
-                        "Trial Type": f"Type {trial_type}",
-                        "Percentage": value,
-                        "Target Status": target_status.capitalize(),
-                    }
-                    for value in values
-                ]
-            )
-
-    df = pd.DataFrame(data_list)
-    plt.figure(figsize=(10.5, 8))
-    ax = plt.gca()
+            n_values = len(values)
+            trial_type_cols.append(np.full(n_values, f"Type {trial_type}"))
+            percentage_cols.append(np.asarray(values, dtype=np.float64))
+            status_cols.append(np.full(n_values, target_status.capitalize()))
+
+    # Label columns are categorical (small code arrays instead of per-row strings);
+    # categories keep order of appearance, as seaborn saw them as plain strings
+    trial_types = np.concatenate(trial_type_cols)
+    statuses = np.concatenate(status_cols)
+    df = pd.DataFrame(
+        {
+            "Trial Type": pd.Categorical(
+                trial_types, categories=pd.unique(trial_types)
+            ),
+            "Percentage": np.concatenate(percentage_cols),
+            "Target Status": pd.Categorical(statuses, categories=pd.unique(statuses)),
+        }
+    )
+    fig = Figure(figsize=(10.5, 8))
+    ax = fig.subplots()
     ax.set_facecolor("black")
 
     violin_palette = {"Non_target": (1, 0.5, 0, 0.75), "Target": (0, 0, 1, 0.75)}
     dot_palette = {"Non_target": "yellow", "Target": "cyan"}
 
-    plt.axhline(y=33, xmin=0, xmax=1.1, color="red", linestyle="--", linewidth=1.5)
+    ax.axhline(y=33, xmin=0, xmax=1.1, color="red", linestyle="--", linewidth=1.5)
 
     sns.violinplot(
         x="Trial Type",
         y="Percentage",
         hue="Target Status",
         data=df,
-        order=["Type 2", "Type 1"],
-        hue_order=["Target", "Non_target"],
+        order=TYPE_ORDER,
+        hue_order=HUE_ORDER,
         palette={"Non_target": (1, 0.5, 0, 0.75), "Target": (0, 0, 1, 0.75)},
         alpha=0.9,
         split=True,
@@ -1405,20 +1564,33 @@ def create_combined_violin_plot(
         native_scale=True,
         gap=0.1,
         cut=0,
+        ax=ax,
     )
-    sns.despine(left=True)
-
-    sns.swarmplot(
-        x="Trial Type",
-        y="Percentage",
-        hue="Target Status",
-        data=df,
-        palette={"Non_target": "yellow", "Target": "cyan"},
-        dodge=True,
-        alpha=0.9,
-        size=9,
-    )
-    sns.despine(left=True)
+    sns.despine(ax=ax, left=True)
+
+    # Uniformly jittered dots in the same dodged slots swarmplot would use
+    # (the violins' category order, 0.8 width split across hue levels),
+    # without its O(n^2) collision avoidance
+    rng = np.random.default_rng(0)
+    type_codes = {label: code for code, label in enumerate(TYPE_ORDER)}
+    slot_width = 0.8 / len(HUE_ORDER)
+    category_x = df["Trial Type"].map(type_codes).to_numpy(dtype=np.float64)
+    percentages = df["Percentage"].to_numpy()
+    for hue_index, status in enumerate(HUE_ORDER):
+        mask = (df["Target Status"] == status).to_numpy()
+        offset = -0.4 + slot_width * (hue_index + 0.5)
+        jitter = rng.uniform(-0.25 * slot_width, 0.25 * slot_width, size=mask.sum())
+        ax.scatter(
+            category_x[mask] + offset + jitter,
+            percentages[mask],
+            c=dot_palette[status],
+            alpha=0.9,
+            s=81,
+            linewidths=0,
+            zorder=3,
+        )
+    # Categorical axis limits, as swarmplot used to set them
+    ax.set_xlim(-0.5, len(type_codes) - 0.5)
 
     handles = [
         (
@@ -1447,7 +1619,7 @@ def create_combined_violin_plot(
 
     labels = ["Target", "Non-Target"]
 
-    legend = plt.legend(
+    legend = ax.legend(
         handles=handles,
         labels=labels,
         handler_map={tuple: HandlerTuple(ndivide=None)},
@@ -1460,53 +1632,57 @@ def create_combined_violin_plot(
     plt.setp(legend.get_texts(), color="white")
     plt.setp(legend.get_title(), color="white")
 
-    plt.title(
+    ax.set_title(
         "Target and Non-Target Gaze Time Distribution (All Trials)", color="white"
     )
-    plt.ylabel("% Time Exploring", color="white")
-    plt.ylim(-10, 100)
-    plt.xlabel("Trial Type", color="white")
-    plt.text(x=1.15, y=35, s="33% = Chance", fontsize=12, color="red")
-    plt.xticks(
+    ax.set_ylabel("% Time Exploring", color="white")
+    ax.set_ylim(-10, 100)
+    ax.set_xlabel("Trial Type", color="white")
+    ax.text(x=1.15, y=35, s="33% = Chance", fontsize=12, color="red")
+    ax.set_xticks(
         ticks=[0, 1], labels=["Low Interference", "High Interference"], color="white"
     )
-    plt.yticks(color="white")
+    ax.tick_params(axis="y", labelcolor="white")
 
     ax.yaxis.grid(True, color="white", linestyle="-", linewidth=0.2)
 
     violin_plot_path = os.path.join(output_folder, "violin_plot.png")
-    plt.savefig(violin_plot_path, facecolor="black")
-    plt.close()
+    fig.savefig(violin_plot_path, facecolor="black")
+    fig.clear()
     return violin_plot_path
 
 
-def create_combined_scatterplots(trial_data: List[dict], output_folder: str) -> str:
+def create_combined_scatterplots(
+    trial_data: List[dict],
+    output_folder: str,
+    records: List[TrialRecord] | None = None,
+) -> str:
     """
     Aggregate gaze points across trials by target spatial position and render
     a 3-row heatmap (Top: target=left, Middle: target=center, Bottom: target=right).
 
-    Produces `combined_scatterplots.png` in the output folder. Uses seaborn's
-    KDE/contour fill to create a smooth heatmap-like visualization. If a
+    Produces `combined_scatterplots.png` in the output folder. Uses filled KDE
+    contours (see kde_surface) to create a smooth heatmap-like visualization. If a
     position has no data, writes a placeholder text panel.
     """
     print("[INFO] Generating combined_scatterplots.png")
     try:
-        # Collect gaze points grouped by the trial's target position
-        grouped = {"left": [], "center": [], "right": []}
-        all_x = []
-        all_y = []
-        for trial in trial_data:
-            target_pos = get_trial_target_position(trial)
-            if target_pos not in grouped:
+        # Collect gaze points grouped by the trial's target position as per-trial
+        # float32 x/y arrays (structure-of-arrays), concatenated once per position
+        if records is None:
+            records = preprocess_trials(trial_data)
+        grouped_chunks = {"left": ([], []), "center": ([], []), "right": ([], [])}
+        for record in records:
+            if record.target_position not in grouped_chunks or not len(record.xs):
                 continue
-            gaze = trial.get("gazeData", []) or []
-            xs = [pt.get("x", 0.0) for pt in gaze if pt is not None]
-            ys = [pt.get("y", 0.0) for pt in gaze if pt is not None]
-            if xs and ys:
-                paired = list(zip(xs, ys))
-                grouped[target_pos].extend(paired)
-                all_x.extend(xs)
-                all_y.extend(ys)
+            x_chunks, y_chunks = grouped_chunks[record.target_position]
+            x_chunks.append(record.xs.astype(np.float32))
+            y_chunks.append(record.ys.astype(np.float32))
+        grouped = {
+            pos: (np.concatenate(x_chunks), np.concatenate(y_chunks))
+            for pos, (x_chunks, y_chunks) in grouped_chunks.items()
+            if x_chunks
+        }
 
         combined_fig, axes = plt.subplots(
             3, 1, figsize=(8, 12), dpi=100, constrained_layout=True
@@ -1515,10 +1691,13 @@ def create_combined_scatterplots(trial_data: List[dict], output_folder: str) ->
         title_map = {0: "Target: Left", 1: "Target: Center", 2: "Target: Right"}
         pos_order = ["left", "center", "right"]
 
-        # Compute global bounds for consistent panel scales
-        if all_x and all_y:
-            x_min, x_max = min(all_x), max(all_x)
-            y_min, y_max = min(all_y), max(all_y)
+        # Compute global bounds for consistent panel scales from the per-position
+        # arrays (no second, all-positions concatenation just for min/max)
+        if grouped:
+            x_min = min(float(xs.min()) for xs, _ in grouped.values())
+            x_max = max(float(xs.max()) for xs, _ in grouped.values())
+            y_min = min(float(ys.min()) for _, ys in grouped.values())
+            y_max = max(float(ys.max()) for _, ys in grouped.values())
             # Add a tiny padding
             x_pad = (x_max - x_min) * 0.03 if x_max > x_min else 1.0
             y_pad = (y_max - y_min) * 0.03 if y_max > y_min else 1.0
@@ -1531,13 +1710,13 @@ def create_combined_scatterplots(trial_data: List[dict], output_folder: str) ->
         for idx, ax in enumerate(axes):
             ax.set_facecolor("black")
             pos = pos_order[idx]
-            points = grouped.get(pos, [])
+            points = grouped.get(pos)
             ax.set_title(title_map[idx], color="white")
             ax.set_xlim(x_limits)
             ax.set_ylim(y_limits)
             ax.axis("off")
 
-            if not points:
+            if points is None:
                 # Placeholder when no points exist for this target position
                 ax.text(
                     0.5,
@@ -1551,20 +1730,22 @@ def create_combined_scatterplots(trial_data: List[dict], output_folder: str) ->
                 )
                 continue
 
-            xs, ys = zip(*points)
+            xs, ys = points
 
             try:
-                # Use seaborn KDE plot for smooth heatmap-like rendering
-                sns.kdeplot(
-                    x=np.array(xs),
-                    y=np.array(ys),
-                    cmap="magma",
-                    fill=True,
-                    thresh=0.01,
-                    levels=100,
-                    ax=ax,
-                    alpha=0.9,
-                )
+                # Filled KDE contours (same grid and levels as seaborn.kdeplot with
+                # thresh=0.01, levels=100), evaluated by FFT convolution
+                surface = kde_surface(xs, ys)
+                if surface is not None:
+                    x_grid, y_grid, density = surface
+                    ax.contourf(
+                        x_grid,
+                        y_grid,
+                        density,
+                        levels=density_levels(density, thresh=0.01, levels=100),
+                        cmap="magma",
+                        alpha=0.9,
+                    )
                 # Overlay a low-opacity scatter so raw points are still visible
                 ax.scatter(xs, ys, s=6, c="yellow", alpha=0.3)
             except Exception as e:
@@ -1601,12 +1782,40 @@ def create_combined_scatterplots(trial_data: List[dict], output_folder: str) ->
         return fallback_path
 
 
+def describe_times(values: np.ndarray) -> Dict[str, float]:
+    """
+    Summarise a 1-D array of percentages for the descriptive statistics table.
+
+    Args:
+        values: Non-empty array of gaze percentages
+
+    Returns:
+        Dict[str, float]: "mean", "std" (population), "median", "min" and "max"
+    """
+    # One sort yields min, max and median; mean/std stay on the original order so the
+    # reported values match np.mean/np.std exactly
+    ordered = np.sort(values)
+    n_values = len(ordered)
+    return {
+        "mean": values.mean(),
+        "std": values.std(),
+        "median": (ordered[(n_values - 1) // 2] + ordered[n_values // 2]) / 2,
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
 def perform_statistical_analysis(
-    types_data: Dict[str, Dict[str, List[float]]],
+    types_data: Dict[str, Dict[str, np.ndarray]],
 ) -> Dict[str, Any]:
     """Perform statistical analysis on the gaze data."""
-    target_times = types_data["1"]["target"] + types_data["2"]["target"]
-    non_target_times = types_data["1"]["non_target"] + types_data["2"]["non_target"]
+    # Convert once; every test below (and the report) reuses these float64 arrays
+    target_times = np.concatenate(
+        [types_data["1"]["target"], types_data["2"]["target"]]
+    ).astype(np.float64, copy=False)
+    non_target_times = np.concatenate(
+        [types_data["1"]["non_target"], types_data["2"]["non_target"]]
+    ).astype(np.float64, copy=False)
 
     # Shapiro-Wilk test
     shapiro_target = shapiro(target_times)
@@ -1616,7 +1825,7 @@ def perform_statistical_analysis(
     levene_test = levene(target_times, non_target_times)
 
     # Wilcoxon test (Target > 33%)
-    w_test_33 = wilcoxon(np.array(target_times) - 33, alternative="greater")
+    w_test_33 = wilcoxon(target_times - 33, alternative="greater")
 
     # Wilcoxon test (Target vs Non-Target)
     w_test_target_vs_non = wilcoxon(target_times, non_target_times)
@@ -1625,13 +1834,18 @@ def perform_statistical_analysis(
     t_test_target_vs_non = ttest_ind(target_times, non_target_times)
     df_ttest = len(target_times) + len(non_target_times) - 2
 
-    # ANOVA
-    anova_test = f_oneway(types_data["1"]["target"], types_data["2"]["target"])
+    # ANOVA (Type 1 vs Type 2 target times: views into target_times, no re-conversion)
+    n_type1_targets = len(types_data["1"]["target"])
+    anova_test = f_oneway(
+        target_times[:n_type1_targets], target_times[n_type1_targets:]
+    )
     df_between = 1
     df_within = len(target_times) - 2
 
-    # Calculate difference
-    difference = np.mean(target_times) - np.mean(non_target_times)
+    # Descriptive statistics, computed once for both the table and the difference
+    desc_target = describe_times(target_times)
+    desc_non_target = describe_times(non_target_times)
+    difference = desc_target["mean"] - desc_non_target["mean"]
 
     return {
         "shapiro_target": shapiro_target,
@@ -1647,35 +1861,61 @@ def perform_statistical_analysis(
         "difference": difference,
         "target_times": target_times,
         "non_target_times": non_target_times,
+        "desc_target": desc_target,
+        "desc_non_target": desc_non_target,
     }
 
 
 def generate_descriptive_statistics(
-    target_times: List[float], non_target_times: List[float]
+    desc_target: Dict[str, float], desc_non_target: Dict[str, float]
 ) -> str:
-    """Generate descriptive statistics table."""
+    """Generate descriptive statistics table from describe_times() summaries."""
     return generate_table(
         headers=["Measure", "Target Object Gaze", "Non-Target Objects Gaze"],
         data=[
-            ["Mean", np.mean(target_times), np.mean(non_target_times)],
-            ["Standard Deviation", np.std(target_times), np.std(non_target_times)],
-            ["Median", np.median(target_times), np.median(non_target_times)],
-            ["Min", np.min(target_times), np.min(non_target_times)],
-            ["Max", np.max(target_times), np.max(non_target_times)],
+            [label, desc_target[key], desc_non_target[key]]
+            for label, key in (
+                ("Mean", "mean"),
+                ("Standard Deviation", "std"),
+                ("Median", "median"),
+                ("Min", "min"),
+                ("Max", "max"),
+            )
         ],
     )
 
 
 def generate_summary_paragraph(stats: Dict[str, Any]) -> str:
     """Generate executive summary paragraph."""
+
+    # Each p-value picks the wording and is printed alongside it; look it up once
+    def verdict(key: str, significant: str, otherwise: str) -> Tuple[str, str]:
+        pvalue = stats[key].pvalue
+        return (significant if pvalue < 0.05 else otherwise), format_pvalue(pvalue)
+
+    sh_t_txt, sh_t_p = verdict("shapiro_target", "did not follow", "followed")
+    sh_nt_txt, sh_nt_p = verdict("shapiro_non_target", "did not follow", "followed")
+    lev_txt, lev_p = verdict("levene_test", "not equal", "equal")
+    w33_txt, w33_p = verdict(
+        "w_test_33", "significantly greater", "not significantly greater"
+    )
+    w_tn_txt, w_tn_p = verdict(
+        "w_test_target_vs_non", "a significant difference", "no significant difference"
+    )
+    t_tn_txt, t_tn_p = verdict(
+        "t_test_target_vs_non", "a significant difference", "no significant difference"
+    )
+    anova_txt, anova_p = verdict(
+        "anova_test", "significantly different", "not significantly different"
+    )
     return f"""
 ### Executive Summary
 
-This analysis examined the gaze data across different trial types to determine if there were significant differences in gaze behavior. The Shapiro-Wilk test for normality indicated that the target gaze data {"did not follow" if stats["shapiro_target"].pvalue < 0.05 else "followed"} a normal distribution (p-value: {format_pvalue(stats["shapiro_target"].pvalue)}), while the non-target gaze data {"did not follow" if stats["shapiro_non_target"].pvalue < 0.05 else "followed"} a normal distribution (p-value: {format_pvalue(stats["shapiro_non_target"].pvalue)}). Levene's test for homoscedasticity showed that the variances between target and non-target gaze data were {"not equal" if stats["levene_test"].pvalue < 0.05 else "equal"} (p-value: {format_pvalue(stats["levene_test"].pvalue)}).
+This analysis examined the gaze data across different trial types to determine if there were significant differences in gaze behavior. The Shapiro-Wilk test for normality indicated that the target gaze data {sh_t_txt} a normal distribution (p-value: {sh_t_p}), while the non-target gaze data {sh_nt_txt} a normal distribution (p-value: {sh_nt_p}). Levene's test for homoscedasticity showed that the variances between target and non-target gaze data were {lev_txt} (p-value: {lev_p}).
 
-The Wilcoxon signed-rank test revealed that the target gaze percentage was {"significantly greater" if stats["w_test_33"].pvalue < 0.05 else "not significantly greater"} than 33% (p-value: {format_pvalue(stats["w_test_33"].pvalue)}). Additionally, the Wilcoxon test comparing target and non-target gaze percentages indicated that there was {"a significant difference" if stats["w_test_target_vs_non"].pvalue < 0.05 else "no significant difference"} between the two conditions (p-value: {format_pvalue(stats["w_test_target_vs_non"].pvalue)}).
+The Wilcoxon signed-rank test revealed that the target gaze percentage was {w33_txt} than 33% (p-value: {w33_p}). Additionally, the Wilcoxon test comparing target and non-target gaze percentages indicated that there was {w_tn_txt} between the two conditions (p-value: {w_tn_p}).
 
-The independent t-test comparing target gaze percentages between Trial Type 1 and Trial Type 2 showed that there was {"a significant difference" if stats["t_test_target_vs_non"].pvalue < 0.05 else "no significant difference"} between the two trial types (p-value: {format_pvalue(stats["t_test_target_vs_non"].pvalue)}). Finally, the one-way ANOVA test indicated that the target gaze percentages across different trial types were {"significantly different" if stats["anova_test"].pvalue < 0.05 else "not significantly different"} (p-value: {format_pvalue(stats["anova_test"].pvalue)}).
+The independent t-test comparing target gaze percentages between Trial Type 1 and Trial Type 2 showed that there was {t_tn_txt} between the two trial types (p-value: {t_tn_p}). Finally, the one-way ANOVA test indicated that the target gaze percentages across different trial types were {anova_txt} (p-value: {anova_p}).
 
 Overall, these results provide insights into the gaze behavior across different trial types, highlighting significant differences where applicable.
 """
@@ -1684,7 +1924,7 @@ Overall, these results provide insights into the gaze behavior across different
 def write_markdown_report(
     output_folder: str,
     json_file_name: str,
-    types_data: Dict[str, Dict[str, List[float]]],
+    types_data: Dict[str, Dict[str, np.ndarray]],
     scatter_plot_path: str,
     violin_plot_path: str,
     percentage_plot_path: str,
@@ -1698,194 +1938,197 @@ def write_markdown_report(
 
     # Perform statistical analysis
     stats = perform_statistical_analysis(types_data)
+    # Reported under both the Wilcoxon and the t-test tables
+    difference_text = format_difference(stats["difference"])
 
-    with open(md_file_path, "w") as md_file:
-        # Title
-        md_file.write(f"# Analysis Report for {json_file_name}\n")
+    # Image links are relative to the report's folder, so they keep working when the
+    # folder is moved; resolve them against a single getcwd() call
+    cwd = os.getcwd()
+    report_dir = os.path.join(cwd, output_folder)
 
-        # Plots
-        md_file.write(
-            print_markdown_description(
-                f"Scatter Plots of Gaze Data (Red Ellipse Represents Center of Highest Concentration)\n"
-            )
-        )
-        md_file.write(f"![Scatter Plots]({os.path.abspath(scatter_plot_path)})\n\n")
+    def link(path: str) -> str:
+        return os.path.relpath(os.path.join(cwd, path), report_dir)
 
-        if combined_scatter_path:
-            md_file.write(
-                print_markdown_description(
-                    "Combined Heatmaps by Target Position (Top: Left, Middle: Center, Bottom: Right)\n"
-                )
-            )
-            md_file.write(f"![Combined Heatmaps]({os.path.abspath(combined_scatter_path)})\n\n")
+    # Assemble the whole report in memory and write it out once
+    chunks: List[str] = []
 
-        md_file.write(
-            print_markdown_description(
-                "Trajectory Plots (Vectors Color-Coded by Direction)\n"
-            )
-        )
-        md_file.write(
-            f"![Trajectory Plots]({os.path.abspath(trajectory_plot_path)})\n\n"
-        )
+    # Title
+    chunks.append(f"# Analysis Report for {json_file_name}\n")
 
-        md_file.write(
-            print_markdown_description("Per-Trial % Time in Target vs Outside Target\n")
-        )
-        md_file.write(
-            f"![Trial Percentage Plots]({os.path.abspath(percentage_plot_path)})\n\n"
+    # Plots
+    chunks.append(
+        print_markdown_description(
+            f"Scatter Plots of Gaze Data (Red Ellipse Represents Center of Highest Concentration)\n"
         )
+    )
+    chunks.append(f"![Scatter Plots]({link(scatter_plot_path)})\n\n")
 
-        md_file.write(
+    if combined_scatter_path:
+        chunks.append(
             print_markdown_description(
-                "Per-Trial Observation Counts (Target vs Outside)\n"
+                "Combined Heatmaps by Target Position (Top: Left, Middle: Center, Bottom: Right)\n"
             )
         )
-        md_file.write(f"![Trial Count Plots]({os.path.abspath(count_plot_path)})\n\n")
+        chunks.append(f"![Combined Heatmaps]({link(combined_scatter_path)})\n\n")
 
-        md_file.write(
-            print_markdown_description(
-                "Per-Trial Time Distribution Across Screen Positions (Left, Center, Right)\n"
-            )
+    chunks.append(
+        print_markdown_description(
+            "Trajectory Plots (Vectors Color-Coded by Direction)\n"
         )
-        md_file.write(f"![Trial Time Plots]({os.path.abspath(time_plot_path)})\n\n")
-        md_file.write(print_markdown_description(f"Violin Plot of Gaze Data\n"))
+    )
+    chunks.append(f"![Trajectory Plots]({link(trajectory_plot_path)})\n\n")
 
-        md_file.write(f"![Violin Plot]({os.path.abspath(violin_plot_path)})\n\n")
+    chunks.append(
+        print_markdown_description("Per-Trial % Time in Target vs Outside Target\n")
+    )
+    chunks.append(f"![Trial Percentage Plots]({link(percentage_plot_path)})\n\n")
 
-        # Descriptive Statistics
-        md_file.write(
-            print_markdown_description(
-                "Descriptive Statistics for Gaze Percentages (Target vs Combined Non-Target Objects)"
-            )
-        )
-        md_file.write(
-            generate_descriptive_statistics(
-                stats["target_times"], stats["non_target_times"]
-            )
-        )
+    chunks.append(
+        print_markdown_description("Per-Trial Observation Counts (Target vs Outside)\n")
+    )
+    chunks.append(f"![Trial Count Plots]({link(count_plot_path)})\n\n")
 
-        # Normality Test
-        md_file.write(
-            print_markdown_description(f"Shapiro-Wilk Test for Normality\n\n")
-        )
-        md_file.write(
-            "This test checks whether the data follows a normal distribution. It returns a test statistic "
-            "and a p-value. A p-value less than 0.05 indicates that the data significantly deviates from "
-            "a normal distribution.\n\n"
-        )
-        md_file.write(
-            generate_table(
-                headers=["Measure", "W Statistic", "p-value"],
-                data=[
-                    [
-                        "Target Gaze",
-                        stats["shapiro_target"].statistic,
-                        format_pvalue(stats["shapiro_target"].pvalue),
-                    ],
-                    [
-                        "Non-Target Gaze",
-                        stats["shapiro_non_target"].statistic,
-                        format_pvalue(stats["shapiro_non_target"].pvalue),
-                    ],
-                ],
-            )
+    chunks.append(
+        print_markdown_description(
+            "Per-Trial Time Distribution Across Screen Positions (Left, Center, Right)\n"
         )
+    )
+    chunks.append(f"![Trial Time Plots]({link(time_plot_path)})\n\n")
+    chunks.append(print_markdown_description(f"Violin Plot of Gaze Data\n"))
+
+    chunks.append(f"![Violin Plot]({link(violin_plot_path)})\n\n")
 
-        # Homoscedasticity Test
-        md_file.write(
-            print_markdown_description(f"Levene's Test for Homoscedasticity\n\n")
+    # Descriptive Statistics
+    chunks.append(
+        print_markdown_description(
+            "Descriptive Statistics for Gaze Percentages (Target vs Combined Non-Target Objects)"
         )
-        md_file.write(
-            generate_table(
-                headers=["W Statistic", "p-value"],
-                data=[
-                    [
-                        stats["levene_test"].statistic,
-                        format_pvalue(stats["levene_test"].pvalue),
-                    ]
+    )
+    chunks.append(
+        generate_descriptive_statistics(stats["desc_target"], stats["desc_non_target"])
+    )
+
+    # Normality Test
+    chunks.append(print_markdown_description(f"Shapiro-Wilk Test for Normality\n\n"))
+    chunks.append(
+        "This test checks whether the data follows a normal distribution. It returns a test statistic "
+        "and a p-value. A p-value less than 0.05 indicates that the data significantly deviates from "
+        "a normal distribution.\n\n"
+    )
+    chunks.append(
+        generate_table(
+            headers=["Measure", "W Statistic", "p-value"],
+            data=[
+                [
+                    "Target Gaze",
+                    stats["shapiro_target"].statistic,
+                    format_pvalue(stats["shapiro_target"].pvalue),
                 ],
-            )
+                [
+                    "Non-Target Gaze",
+                    stats["shapiro_non_target"].statistic,
+                    format_pvalue(stats["shapiro_non_target"].pvalue),
+                ],
+            ],
         )
+    )
 
-        # Wilcoxon Tests
-        md_file.write(
-            print_markdown_description(f"Wilcoxon Test (One-Sided; Target >= 33%)\n\n")
+    # Homoscedasticity Test
+    chunks.append(print_markdown_description(f"Levene's Test for Homoscedasticity\n\n"))
+    chunks.append(
+        generate_table(
+            headers=["W Statistic", "p-value"],
+            data=[
+                [
+                    stats["levene_test"].statistic,
+                    format_pvalue(stats["levene_test"].pvalue),
+                ]
+            ],
         )
-        md_file.write(
-            generate_table(
-                headers=["W Statistic", "p-value"],
-                data=[
-                    [
-                        stats["w_test_33"].statistic,
-                        format_pvalue(stats["w_test_33"].pvalue),
-                    ]
-                ],
-            )
+    )
+
+    # Wilcoxon Tests
+    chunks.append(
+        print_markdown_description(f"Wilcoxon Test (One-Sided; Target >= 33%)\n\n")
+    )
+    chunks.append(
+        generate_table(
+            headers=["W Statistic", "p-value"],
+            data=[
+                [
+                    stats["w_test_33"].statistic,
+                    format_pvalue(stats["w_test_33"].pvalue),
+                ]
+            ],
         )
+    )
 
-        md_file.write(
-            print_markdown_description(
-                f"Wilcoxon Test (Two-Sided; Target vs Non-Target)\n\n"
-            )
+    chunks.append(
+        print_markdown_description(
+            f"Wilcoxon Test (Two-Sided; Target vs Non-Target)\n\n"
         )
-        md_file.write(
-            generate_table(
-                headers=["W Statistic", "p-value"],
-                data=[
-                    [
-                        stats["w_test_target_vs_non"].statistic,
-                        format_pvalue(stats["w_test_target_vs_non"].pvalue),
-                    ]
-                ],
-            )
+    )
+    chunks.append(
+        generate_table(
+            headers=["W Statistic", "p-value"],
+            data=[
+                [
+                    stats["w_test_target_vs_non"].statistic,
+                    format_pvalue(stats["w_test_target_vs_non"].pvalue),
+                ]
+            ],
         )
-        md_file.write(f"**Difference**: {format_difference(stats['difference'])}\n")
+    )
+    chunks.append(f"**Difference**: {difference_text}\n")
 
-        # T-Test
-        md_file.write(
-            print_markdown_description(f"T-Test (Two-Sided; Target vs Non-Target)\n\n")
-        )
-        md_file.write(
-            generate_table(
-                headers=["T-Statistic", "Degrees of Freedom", "p-value"],
-                data=[
-                    [
-                        stats["t_test_target_vs_non"].statistic,
-                        stats["df_ttest"],
-                        format_pvalue(stats["t_test_target_vs_non"].pvalue),
-                    ]
-                ],
-            )
+    # T-Test
+    chunks.append(
+        print_markdown_description(f"T-Test (Two-Sided; Target vs Non-Target)\n\n")
+    )
+    chunks.append(
+        generate_table(
+            headers=["T-Statistic", "Degrees of Freedom", "p-value"],
+            data=[
+                [
+                    stats["t_test_target_vs_non"].statistic,
+                    stats["df_ttest"],
+                    format_pvalue(stats["t_test_target_vs_non"].pvalue),
+                ]
+            ],
         )
-        md_file.write(f"**Difference**: {format_difference(stats['difference'])}\n\n")
+    )
+    chunks.append(f"**Difference**: {difference_text}\n\n")
 
-        # ANOVA
-        md_file.write(
-            print_markdown_description(
-                "ANOVA (Target Gaze Percentages across Trial Types)\n\n"
-            )
+    # ANOVA
+    chunks.append(
+        print_markdown_description(
+            "ANOVA (Target Gaze Percentages across Trial Types)\n\n"
         )
-        md_file.write(
-            generate_table(
-                headers=[
-                    "F-Statistic",
-                    "Degrees of Freedom (Between)",
-                    "Degrees of Freedom (Within)",
-                    "p-value",
-                ],
-                data=[
-                    [
-                        stats["anova_test"].statistic,
-                        stats["df_between"],
-                        stats["df_within"],
-                        format_pvalue(stats["anova_test"].pvalue),
-                    ]
-                ],
-            )
+    )
+    chunks.append(
+        generate_table(
+            headers=[
+                "F-Statistic",
+                "Degrees of Freedom (Between)",
+                "Degrees of Freedom (Within)",
+                "p-value",
+            ],
+            data=[
+                [
+                    stats["anova_test"].statistic,
+                    stats["df_between"],
+                    stats["df_within"],
+                    format_pvalue(stats["anova_test"].pvalue),
+                ]
+            ],
         )
+    )
 
-        # Summary
-        md_file.write(generate_summary_paragraph(stats))
+    # Summary
+    chunks.append(generate_summary_paragraph(stats))
+
+    with open(md_file_path, "w", encoding="utf-8") as md_file:
+        md_file.write("".join(chunks))
 
 
 def main():
@@ -1895,15 +2138,47 @@ def main():
     output_folder, json_file_name = setup_output_directory(args.json_file_path)
 
     trial_data = data["trialData"]
-    types_data = process_trial_data(trial_data)
-
-    scatter_plot_path = create_scatter_plots(trial_data, output_folder)
-    combined_scatter_path = create_combined_scatterplots(trial_data, output_folder)
-    percentage_plot_path = create_trial_percentage_plots(trial_data, output_folder)
-    count_plot_path = create_trial_count_plots(trial_data, output_folder)
-    trajectory_plot_path = create_trajectory_plots(trial_data, output_folder)
-    time_plot_path = create_trial_time_plots(trial_data, output_folder)
-    violin_plot_path = create_combined_violin_plot(types_data, output_folder)
+    del data  # drops the session-level gazeData duplicate when the file was parsed whole
+    # Gaze samples are walked once here; every summary and plot reuses the arrays
+    records = preprocess_trials(trial_data)
+    # The raw sample dicts are no longer needed and would otherwise be pickled
+    # into every figure worker alongside the arrays
+    for trial in trial_data:
+        trial.pop("gazeData", None)
+    types_data = process_trial_data(trial_data, records)
+
+    # Each figure is independent and writes its own PNG, so they render in
+    # separate processes (Agg is not thread-safe) and only the paths come back
+    with ProcessPoolExecutor() as executor:
+        scatter_future = executor.submit(
+            create_scatter_plots, trial_data, output_folder, records
+        )
+        combined_scatter_future = executor.submit(
+            create_combined_scatterplots, trial_data, output_folder, records
+        )
+        percentage_future = executor.submit(
+            create_trial_percentage_plots, trial_data, output_folder, records
+        )
+        count_future = executor.submit(
+            create_trial_count_plots, trial_data, output_folder, records
+        )
+        trajectory_future = executor.submit(
+            create_trajectory_plots, trial_data, output_folder, records
+        )
+        time_future = executor.submit(
+            create_trial_time_plots, trial_data, output_folder, records
+        )
+        violin_future = executor.submit(
+            create_combined_violin_plot, types_data, output_folder
+        )
+
+    scatter_plot_path = scatter_future.result()
+    combined_scatter_path = combined_scatter_future.result()
+    percentage_plot_path = percentage_future.result()
+    count_plot_path = count_future.result()
+    trajectory_plot_path = trajectory_future.result()
+    time_plot_path = time_future.result()
+    violin_plot_path = violin_future.result()
 
     write_markdown_report(
         output_folder,
@@ -40,14 +40,38 @@ Notes:
 
 import argparse
 import json
-import math
 import os
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import matplotlib
+
+try:
+    import ijson  # Optional: streams bins without materializing the whole file
+
+    # The pure-Python backend is an order of magnitude slower than json.load
+    if ijson.backend == "python":
+        ijson = None
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: fastest whole-document parse
+except ImportError:
+    orjson = None
+
+# Use non-interactive backend for headless environments (output is saved, never shown)
+matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.gridspec import GridSpec
 
+# Inputs at least this large are streamed bin by bin with ijson rather than parsed whole
+# (same threshold as AnalysisPlotting.py)
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+# Top-level fields used for the figure title
+METADATA_KEYS = ("userInitials", "video")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -94,55 +118,125 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_gaze_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_gaze_json(path: str) -> Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]:
+    """
+    Load the session metadata and its bins. Returns (data, bins).
+    Files are parsed whole with orjson when it is installed (standard library otherwise).
+    Files of STREAMING_THRESHOLD_BYTES or more are streamed with ijson when a compiled
+    backend is available: data then only holds METADATA_KEYS, and bins is a lazy
+    iterator that keeps one bin's samples in memory at a time.
+    """
+    if ijson is not None and os.path.getsize(path) >= STREAMING_THRESHOLD_BYTES:
+        return read_metadata(path), stream_bins(path)
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    return data, data.get("bins", [])
+
+
+def read_metadata(path: str) -> Dict[str, Any]:
+    """
+    Read the top-level METADATA_KEYS string fields with ijson, stopping as soon as all
+    of them have been seen (normally before the bins array starts).
+    """
+    data: Dict[str, Any] = {}
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in METADATA_KEYS and event == "string":
+                data[prefix] = value
+                if len(data) == len(METADATA_KEYS):
+                    break
+    return data
+
 
+def stream_bins(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the bins of a gaze JSON file one at a time."""
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "bins.item", use_float=True)
 
-def collect_all_samples(bins: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+
+def bin_sample_arrays(bin_data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract one bin's valid samples as parallel float64 x and y arrays.
+    Samples with a missing, non-numeric, or non-finite coordinate are dropped.
     """
-    Flatten all bin samples into a single list, filtering invalid entries.
+    # Non-numeric coordinates become NaN so a single isfinite mask drops every
+    # invalid sample
+    coords = np.array(
+        [
+            (
+                (x, y)
+                if isinstance(x, (int, float)) and isinstance(y, (int, float))
+                else (np.nan, np.nan)
+            )
+            for x, y in ((s.get("x"), s.get("y")) for s in bin_data.get("samples", []))
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    coords = coords[np.isfinite(coords).all(axis=1)]
+    return coords[:, 0], coords[:, 1]
+
+
+def collect_all_samples(
+    bins: Iterable[Dict[str, Any]],
+) -> Tuple[List[Tuple[np.ndarray, np.ndarray]], np.ndarray, np.ndarray]:
     """
-    all_samples: List[Dict[str, float]] = []
-    for b in bins:
-        samples = b.get("samples", [])
-        for s in samples:
-            x = s.get("x")
-            y = s.get("y")
-            if x is None or y is None:
-                continue
-            if not (isinstance(x, (int, float)) and isinstance(y, (int, float))):
-                continue
-            if math.isfinite(x) and math.isfinite(y):
-                all_samples.append({"x": float(x), "y": float(y)})
-    return all_samples
-
-
-def get_extent_from_samples(samples: List[Dict[str, float]]) -> Tuple[float, float]:
+    Convert every bin's valid samples to arrays (see bin_sample_arrays) in one pass.
+    Returns (per-bin (xs, ys) pairs, all xs, all ys).
+    """
+    per_bin = [bin_sample_arrays(b) for b in bins]
+    if not per_bin:
+        return per_bin, np.empty(0), np.empty(0)
+    all_xs = np.concatenate([xs for xs, _ in per_bin])
+    all_ys = np.concatenate([ys for _, ys in per_bin])
+    return per_bin, all_xs, all_ys
+
+
+def get_extent_from_samples(xs: np.ndarray, ys: np.ndarray) -> Tuple[float, float]:
     """
     Infer screen extents from maximum x and y across samples.
     Returns (width, height). If insufficient data, returns (1920, 1080).
     """
-    if not samples:
+    if not len(xs):
         return (1920.0, 1080.0)
-    max_x = max((s["x"] for s in samples), default=0.0)
-    max_y = max((s["y"] for s in samples), default=0.0)
+    max_x = xs.max()
+    max_y = ys.max()
     width = max(1.0, float(max_x))
     height = max(1.0, float(max_y))
     # Add a small margin so points at max values are included nicely
     return (width * 1.01, height * 1.01)
 
 
+def uniform_bin_indices(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Bin indices of values already clamped to [edges[0], edges[-1]] for evenly spaced
+    edges, matching np.histogram: bin k holds edges[k] <= v < edges[k + 1], and the
+    last bin also holds v == edges[-1].
+    """
+    n_bins = len(edges) - 1
+    scale = n_bins / (edges[-1] - edges[0])
+    # Closed-form multiply-and-floor instead of a searchsorted over the edges ...
+    idx = np.minimum(((values - edges[0]) * scale).astype(np.intp), n_bins - 1)
+    # ... then nudge values that rounding put one bin off their edge comparison
+    idx -= values < edges[idx]
+    idx += (values >= edges[idx + 1]) & (idx < n_bins - 1)
+    return idx
+
+
 def compute_hist2d(
-    samples: List[Dict[str, float]],
+    groups: List[Tuple[np.ndarray, np.ndarray]],
     width: float,
     height: float,
     bins_x: int,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Compute a 2D histogram (heatmap) using numpy for given samples and domain extents.
+    Compute one 2D histogram (heatmap) per (xs, ys) sample group, all in a single pass.
     bins_x determines number of x-bins; y-bins are scaled by the aspect ratio.
-    Returns (H, x_edges, y_edges). Note: y_edges are in screen coordinates (top-left origin later handled by imshow origin='upper').
+    Returns (counts, x_edges, y_edges) with counts shaped (len(groups), bins_y, bins_x);
+    see histogram_density. Note: y_edges are in screen coordinates (top-left origin later handled by imshow origin='upper').
     """
     if width <= 0 or height <= 0:
         width, height = 1920.0, 1080.0
@@ -150,43 +244,61 @@ def compute_hist2d(
     # Determine number of bins on Y to preserve aspect ratio
     aspect = height / width if width > 0 else 1.0
     bins_y = max(1, int(round(bins_x * aspect)))
+    x_edges = np.linspace(0, width, bins_x + 1)
+    y_edges = np.linspace(0, height, bins_y + 1)
 
-    if not samples:
-        # Return empty histogram
-        H = np.zeros((bins_y, bins_x), dtype=float)
-        x_edges = np.linspace(0, width, bins_x + 1)
-        y_edges = np.linspace(0, height, bins_y + 1)
-        return H, x_edges, y_edges
-
-    xs = np.array([s["x"] for s in samples], dtype=float)
-    ys = np.array([s["y"] for s in samples], dtype=float)
+    sizes = [len(xs) for xs, _ in groups]
+    if not any(sizes):
+        # Return empty histograms
+        return np.zeros((len(groups), bins_y, bins_x), dtype=np.intp), x_edges, y_edges
 
     # Clamp to domain [0, width], [0, height] to avoid out-of-range issues
-    xs = np.clip(xs, 0.0, width)
-    ys = np.clip(ys, 0.0, height)
-
-    H, x_edges, y_edges = np.histogram2d(
-        ys,  # row dimension (first) corresponds to Y (so we pass Y first)
-        xs,  # column dimension corresponds to X
-        bins=[bins_y, bins_x],
-        range=[[0.0, height], [0.0, width]],
-        density=True,
-    )
-
-    # Optional: normalize to density or leave as counts.
-    # For now we leave as counts to reflect absolute dwell frequency.
-    return H, x_edges, y_edges
+    xs = np.clip(np.concatenate([xs for xs, _ in groups]), 0.0, width)
+    ys = np.clip(np.concatenate([ys for _, ys in groups]), 0.0, height)
+
+    ix = uniform_bin_indices(xs, x_edges)
+    iy = uniform_bin_indices(ys, y_edges)
+    group_ids = np.repeat(np.arange(len(groups)), sizes)
+    # One bincount over the flattened (group, row, column) index fills every grid;
+    # rows correspond to Y, columns to X
+    flat = (group_ids * bins_y + iy) * bins_x + ix
+    counts = np.bincount(flat, minlength=len(groups) * bins_y * bins_x)
+    return counts.reshape(len(groups), bins_y, bins_x), x_edges, y_edges
+
+
+def histogram_density(
+    counts: np.ndarray, x_edges: np.ndarray, y_edges: np.ndarray
+) -> np.ndarray:
+    """
+    Normalize one counts grid from compute_hist2d like np.histogram2d(..., density=True).
+    A grid without samples stays all zeros.
+    """
+    total = counts.sum()
+    if not total:
+        return np.zeros(counts.shape, dtype=float)
+    H = counts / np.diff(y_edges)[:, None]
+    return H / np.diff(x_edges)[None, :] / total
 
 
 def plot_heatmap(
-    ax: plt.Axes, H: np.ndarray, width: float, height: float, cmap: str, title: str = ""
+    ax: plt.Axes,
+    H: np.ndarray,
+    width: float,
+    height: float,
+    cmap: str,
+    title: str = "",
+    vmin: float | None = None,
+    vmax: float | None = None,
 ) -> None:
     """
     Plot a single heatmap with origin at upper-left to match screen coords.
+    vmin/vmax fix the color scale; by default it spans this heatmap's own range.
     """
     ax.imshow(
         H,
         cmap=cmap,
+        vmin=vmin,
+        vmax=vmax,
         origin="upper",  # top-left corresponds to (0,0)
         extent=[
             0,
@@ -222,16 +334,29 @@ def build_figure_layout(figwidth: float) -> Tuple[plt.Figure, GridSpec]:
 def main():
     args = parse_args()
 
-    data = load_gaze_json(args.input)
-    bins_data = data.get("bins", [])
+    data, bins_data = load_gaze_json(args.input)
+
+    # Convert every bin once; the minute panels and the overall extent/heatmap
+    # all reuse these arrays
+    bin_samples, all_xs, all_ys = collect_all_samples(bins_data)
+    width, height = get_extent_from_samples(all_xs, all_ys)
 
-    # Flatten all samples for overall extent
-    all_samples = collect_all_samples(bins_data)
-    width, height = get_extent_from_samples(all_samples)
+    # All eleven heatmaps come from one binning pass: a group per displayed minute
+    # (empty when the session is shorter), then any later bins, which only
+    # contribute to the overall map
+    empty = (np.empty(0), np.empty(0))
+    groups = [bin_samples[i] if i < len(bin_samples) else empty for i in range(10)]
+    counts, x_edges, y_edges = compute_hist2d(
+        groups + bin_samples[10:], width, height, bins_x=args.bins
+    )
 
     # Prepare figure layout
     fig, gs = build_figure_layout(args.figwidth)
 
+    # The minute maps share one color scale so they can be compared with each other
+    minute_H = [histogram_density(counts[i], x_edges, y_edges) for i in range(10)]
+    minute_vmax = max(float(H.max()) for H in minute_H)
+
     # Plot 1-minute heatmaps in 2 rows x 5 columns
     minute_axes: List[plt.Axes] = []
     for i in range(10):
@@ -240,26 +365,21 @@ def main():
         ax = fig.add_subplot(gs[row, col])
         minute_axes.append(ax)
 
-        bin_data = bins_data[i] if i < len(bins_data) else {"samples": []}
-        samples = []
-        for s in bin_data.get("samples", []):
-            x = s.get("x")
-            y = s.get("y")
-            if (
-                isinstance(x, (int, float))
-                and isinstance(y, (int, float))
-                and math.isfinite(x)
-                and math.isfinite(y)
-            ):
-                samples.append({"x": float(x), "y": float(y)})
-
-        H, _, _ = compute_hist2d(samples, width, height, bins_x=args.bins)
         title = f"Minute {i + 1}"
-        plot_heatmap(ax, H, width, height, cmap=args.cmap, title=title)
+        plot_heatmap(
+            ax,
+            minute_H[i],
+            width,
+            height,
+            cmap=args.cmap,
+            title=title,
+            vmin=0.0,
+            vmax=minute_vmax,
+        )
 
     # Bottom overall heatmap across all 10 minutes
     ax_overall = fig.add_subplot(gs[2, :])
-    H_all, _, _ = compute_hist2d(all_samples, width, height, bins_x=args.bins)
+    H_all = histogram_density(counts.sum(axis=0), x_edges, y_edges)
     overall_title = f"Overall Heatmap (10 minutes)"
     plot_heatmap(ax_overall, H_all, width, height, cmap=args.cmap, title=overall_title)
 